@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import platform
+import tempfile
+import subprocess
+from datetime import datetime
+
+from koenji_doctools.generator import MMAP_THRESHOLD
+
+# Version of the results file layout; bump when the structure changes
+RESULTS_SCHEMA = 1
+
+# Share of files that are large, and the doc densities files are spread across
+LARGE_FILE_RATIO = 0.02
+DOC_DENSITIES = [0.0, 0.25, 0.5, 0.9]
+
+# Every this many files, starting with the first, one is made big enough for the tools to memory-map it
+HUGE_FILE_INTERVAL = 1000
+HUGE_FILE_BYTES = 2 * MMAP_THRESHOLD
+
+FOLDERS = ["Views", "ViewModels", "Models", "Services", "Stores", "Helpers"]
+
+# Package the tool scripts run from
+PACKAGE_NAME = "koenji_doctools"
+
+def print_header(text):
+    """Print a formatted header."""
+    print("\n" + "=" * 80)
+    print(f" {text} ".center(80, "="))
+    print("=" * 80 + "\n")
+
+def swift_type(rng, type_name, member_count, doc_density):
+    """Return the source of a synthetic Swift type with properties and methods."""
+    lines = []
+    
+    def doc(text, indent=""):
+        if rng.random() < doc_density:
+            lines.append(f"{indent}/// {text}")
+    
+    keyword = rng.choice(["class", "struct", "final class", "enum"])
+    doc(f"{type_name} groups related state and behavior.")
+    lines.append(f"{keyword} {type_name} {{")
+    
+    for member in range(member_count):
+        roll = rng.random()
+        if roll < 0.45:
+            doc(f"Value number {member}.", "    ")
+            binding = rng.choice(["let", "var", "private var", "static let", "@Published var"])
+            lines.append(f"    {binding} value{member}: Int = {member}")
+        elif roll < 0.85:
+            doc(f"Performs step {member}.", "    ")
+            lines.append(f"    func step{member}(input: Int) -> Int {{")
+            lines.append(f"        let local{member} = input * {member}")
+            lines.append(f"        if let cached = cache[{member}] {{ return cached }}")
+            lines.append(f"        // let commented{member} = local{member}")
+            lines.append(f"        print(\"let inString{member} = \\(local{member})\")")
+            lines.append(f"        return local{member}")
+            lines.append("    }")
+        else:
+            lines.append(f"    let template{member} = \"\"\"")
+            lines.append(f"        func notAFunction{member}() {{}}")
+            lines.append("        \"\"\"")
+        lines.append("")
+    
+    lines.append("}")
+    lines.append("")
+    
+    lines.append(f"extension {type_name} {{")
+    doc("Convenience entry point.", "    ")
+    lines.append("    func run() {}")
+    lines.append("}")
+    lines.append("")
+    return lines
+
+def generate_corpus(root, file_count, seed=0):
+    """Write a synthetic Swift tree with small, large and memory-mapped files and mixed doc densities."""
+    rng = random.Random(seed)
+    
+    for index in range(file_count):
+        feature = f"Feature{index // 50:03d}"
+        folder = os.path.join(root, feature, FOLDERS[index % len(FOLDERS)])
+        os.makedirs(folder, exist_ok=True)
+        
+        doc_density = DOC_DENSITIES[index % len(DOC_DENSITIES)]
+        huge = index % HUGE_FILE_INTERVAL == 0
+        large = huge or rng.random() < LARGE_FILE_RATIO
+        type_count = rng.randint(40, 60) if large else rng.randint(1, 3)
+        
+        lines = ["import Foundation", "import SwiftUI", ""]
+        size = 0
+        type_index = 0
+        # Huge files keep adding large types until they pass the size
+        while type_index < type_count or (huge and size < HUGE_FILE_BYTES):
+            member_count = rng.randint(20, 40) if large else rng.randint(3, 12)
+            type_lines = swift_type(rng, f"Type{index}x{type_index}", member_count, doc_density)
+            lines.extend(type_lines)
+            size += sum(len(line) + 1 for line in type_lines)
+            type_index += 1
+        
+        with open(os.path.join(folder, f"Generated{index:05d}.swift"), "w") as f:
+            f.write("\n".join(lines))
+
+def prepare_workspace(tools_dir, file_count, seed):
+    """Create a throwaway project with a copy of the tools and a synthetic corpus."""
+    workspace = tempfile.mkdtemp(prefix=f"doc_benchmark_{file_count}_")
+    
+    # The tools write reports next to themselves, so run a copy inside the workspace
+    workspace_tools = os.path.join(workspace, "Documentation", "tools")
+    shutil.copytree(os.path.join(tools_dir, PACKAGE_NAME), os.path.join(workspace_tools, PACKAGE_NAME), ignore=shutil.ignore_patterns("__pycache__"))
+    for tool_file in os.listdir(tools_dir):
+        if tool_file.endswith(".py"):
+            shutil.copy(os.path.join(tools_dir, tool_file), workspace_tools)
+    
+    # The corpus folder doubles as the project root marker the workflow looks for
+    corpus = os.path.join(workspace, "KoenjiApp")
+    generate_corpus(corpus, file_count, seed)
+    return workspace, corpus
+
+def largest_file(corpus):
+    """Return the path of the biggest file in the corpus."""
+    return max(
+        (os.path.join(root, file) for root, _, files in os.walk(corpus) for file in files),
+        key=os.path.getsize
+    )
+
+def benchmark_commands(workspace, corpus, jobs):
+    """Return (name, command, paths to delete before each run) for every tool invocation to time."""
+    tools = os.path.join(workspace, "Documentation", "tools")
+    generator = os.path.join(tools, "documentation_generator_v2.py")
+    audit = os.path.join(tools, "documentation_audit.py")
+    workflow = os.path.join(tools, "doc_workflow.py")
+    jobs_args = ["--jobs", str(jobs)] if jobs else []
+    cache = os.path.join(workspace, "Documentation", "reports", ".cache")
+    index = os.path.join(workspace, "symbols.db")
+    # The corpus folder is its own project root, so its summary and partial results sit at the top of the audits folder
+    audits = os.path.join(workspace, "Documentation", "reports", "audits")
+    partials = [os.path.join(audits, f"{os.path.basename(corpus)}_audit_shard_{shard}_of_2.jsonl") for shard in (1, 2)]
+    # The biggest file is memory-mapped by the single-file commands
+    huge_file = largest_file(corpus)
+    
+    return [
+        ("generator --analyze-only", [sys.executable, generator, corpus, "--analyze-only"] + jobs_args, []),
+        ("generator suggestions", [sys.executable, generator, corpus] + jobs_args, []),
+        ("audit", [sys.executable, audit, corpus, "-o", os.path.join(workspace, "audit_report.md"), "--no-cache"] + jobs_args, []),
+        ("workflow audit", [sys.executable, workflow, "audit", corpus] + jobs_args, [cache]),
+        ("workflow audit (warm cache)", [sys.executable, workflow, "audit", corpus] + jobs_args, []),
+        ("workflow analyze-all", [sys.executable, workflow, "analyze-all", corpus] + jobs_args, []),
+        ("workflow workflow --analyze-all", [sys.executable, workflow, "workflow", corpus, "--analyze-all"] + jobs_args, [cache]),
+        ("workflow prioritize", [sys.executable, workflow, "prioritize", corpus], []),
+        ("workflow analyze (largest file)", [sys.executable, workflow, "analyze", huge_file], []),
+        ("workflow audit-file (largest file)", [sys.executable, workflow, "audit-file", huge_file, "--no-cache"], []),
+        ("workflow audit --shard 1/2", [sys.executable, workflow, "audit", corpus, "--shard", "1/2", "--no-cache"] + jobs_args, []),
+        ("workflow audit --shard 2/2", [sys.executable, workflow, "audit", corpus, "--shard", "2/2", "--no-cache"] + jobs_args, []),
+        ("workflow merge", [sys.executable, workflow, "merge", corpus] + partials, []),
+        ("workflow index", [sys.executable, workflow, "index", corpus, "--db", index], [index]),
+        ("workflow index (unchanged)", [sys.executable, workflow, "index", corpus, "--db", index], []),
+        ("workflow query coverage", [sys.executable, workflow, "query", "coverage", "--db", index], [])
+    ]
+
+def time_command(command, repeat, cleanup_paths=()):
+    """Run a command several times and return its wall-clock durations in seconds."""
+    durations = []
+    for _ in range(repeat):
+        # Start cold runs from a clean slate every time
+        for path in cleanup_paths:
+            if os.path.isdir(path):
+                shutil.rmtree(path)
+            elif os.path.exists(path):
+                os.remove(path)
+        
+        started = time.perf_counter()
+        result = subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        durations.append(time.perf_counter() - started)
+        
+        if result.returncode != 0:
+            print(f"Error running {' '.join(command)}")
+            print(f"stderr: {result.stderr}")
+            return None
+    return durations
+
+def run_benchmarks(sizes, repeat=3, jobs=None, seed=0, keep=False):
+    """Benchmark every tool command against synthetic corpora of the given sizes."""
+    tools_dir = os.path.dirname(os.path.abspath(__file__))
+    results = []
+    
+    for file_count in sizes:
+        print_header(f"Benchmarking {file_count} files")
+        workspace, corpus = prepare_workspace(tools_dir, file_count, seed)
+        corpus_bytes = sum(
+            os.path.getsize(os.path.join(root, file))
+            for root, _, files in os.walk(corpus)
+            for file in files
+        )
+        print(f"Generated {file_count} files ({corpus_bytes / 1024 / 1024:.1f} MB) in {corpus}")
+        
+        try:
+            for name, command, cleanup_paths in benchmark_commands(workspace, corpus, jobs):
+                durations = time_command(command, repeat, cleanup_paths)
+                if durations is None:
+                    continue
+                
+                median = sorted(durations)[len(durations) // 2]
+                print(f"{name:<34} median {median:8.3f}s  min {min(durations):8.3f}s")
+                results.append({
+                    'files': file_count,
+                    'bytes': corpus_bytes,
+                    'command': name,
+                    'seconds': durations,
+                    'median': median
+                })
+        finally:
+            if keep:
+                print(f"Kept benchmark workspace at {workspace}")
+            else:
+                shutil.rmtree(workspace, ignore_errors=True)
+    
+    return {
+        'schema': RESULTS_SCHEMA,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'jobs': jobs,
+        'repeat': repeat,
+        'seed': seed,
+        'results': results
+    }
+
+def compare_with_baseline(report, baseline_file):
+    """Print each command's median next to the stored baseline's."""
+    try:
+        with open(baseline_file, "r") as f:
+            baseline = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Error reading baseline {baseline_file}: {e}")
+        return
+    
+    if baseline.get('schema') != RESULTS_SCHEMA:
+        print(f"Baseline {baseline_file} uses schema {baseline.get('schema')}, expected {RESULTS_SCHEMA}")
+        return
+    
+    baseline_medians = {(entry['files'], entry['command']): entry['median'] for entry in baseline['results']}
+    
+    print_header(f"Comparison with {baseline_file}")
+    for entry in report['results']:
+        previous = baseline_medians.get((entry['files'], entry['command']))
+        if previous is None:
+            continue
+        ratio = entry['median'] / previous if previous > 0 else float('inf')
+        print(f"{entry['files']:>6} files  {entry['command']:<34} {previous:8.3f}s -> {entry['median']:8.3f}s  ({ratio:.2f}x)")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the documentation tools on synthetic Swift trees")
+    parser.add_argument("--sizes", default="100,1000,10000", help="Comma-separated corpus sizes in files (default: 100,1000,10000)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per command (default: 3)")
+    parser.add_argument("--jobs", "-j", type=int, help="Worker processes passed to the tools (default: the tools' own default)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the synthetic corpus (default: 0)")
+    parser.add_argument("--output", "-o", default="benchmark_results.json", help="Where to write the JSON results")
+    parser.add_argument("--baseline", help="Previous results file to compare against")
+    parser.add_argument("--keep", action="store_true", help="Keep the generated workspaces for inspection")
+    args = parser.parse_args()
+    
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    report = run_benchmarks(sizes, repeat=args.repeat, jobs=args.jobs, seed=args.seed, keep=args.keep)
+    
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nBenchmark results saved to {os.path.abspath(args.output)}")
+    
+    if args.baseline:
+        compare_with_baseline(report, args.baseline)
+
+if __name__ == "__main__":
+    main()
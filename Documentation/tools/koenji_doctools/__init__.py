@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+from importlib import import_module
+
+# Classes the package exposes, and the module that defines each. They are imported on
+# first use, so importing the package (or running python3 -m koenji_doctools) loads
+# only the modules the command being run needs
+_EXPORTS = {
+    "DocumentationGenerator": "generator",
+    "AnalysisBudgetExceeded": "generator",
+    "DocumentationAudit": "audit",
+    "AnalysisCache": "analysis_cache",
+    "Coverage": "analysis_results",
+    "FileStats": "analysis_results",
+    "SymbolIndex": "symbol_index",
+    "TimingHistory": "scheduling"
+}
+
+__all__ = sorted(_EXPORTS)
+
+def __getattr__(name):
+    """Import an exported class from its module the first time it is used."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
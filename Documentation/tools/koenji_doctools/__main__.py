@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+import sys
+from importlib import import_module
+
+# Name the tools run under, as in python3 -m koenji_doctools workflow audit KoenjiApp
+PROG = "koenji_doctools"
+
+# Module whose main runs each command, and its description. Only the module of the command
+# being run is imported, and it runs in this process instead of starting another Python
+COMMANDS = {
+    "generator": ("generator", "Generate documentation suggestions or JSON statistics for Swift files"),
+    "audit": ("audit", "Write a documentation coverage report for a directory"),
+    "workflow": ("workflow", "Audit, analyze, watch, index and merge with the documentation workflow")
+}
+
+USAGE = f"usage: {PROG} {{{','.join(COMMANDS)}}} ..."
+
+def print_help():
+    """Print the commands the package runs."""
+    print(USAGE)
+    print("\nDocumentation tools for the Swift sources\n")
+    print("commands:")
+    for command, (_, description) in COMMANDS.items():
+        print(f"  {command:<11} {description}")
+    print(f"\nRun {PROG} COMMAND --help for the options of a command.")
+
+def main(argv=None):
+    """Run a command in this process and return its exit status."""
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv or argv[0] in ("-h", "--help"):
+        print_help()
+        return 0
+    
+    # Each command parses its own options, so they aren't known until its module is loaded
+    command = argv[0]
+    if command not in COMMANDS:
+        print(USAGE, file=sys.stderr)
+        print(f"{PROG}: error: unknown command {command!r}", file=sys.stderr)
+        return 2
+    
+    module = import_module(f".{COMMANDS[command][0]}", __package__)
+    module.main(argv[1:], prog=f"{PROG} {command}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+import os
+import hashlib
+
+from .report_writer import REPORTS_DIR
+from .json_store import JsonStore
+
+# Cache location and size limit
+DEFAULT_CACHE_DIR = os.path.join(REPORTS_DIR, ".cache")
+CACHE_FILE_NAME = "analysis_cache.json"
+MAX_ENTRIES = 5000
+
+# Files are hashed in chunks of this size so large files are never read into memory at once
+HASH_CHUNK_SIZE = 1024 * 1024
+
+def hash_file(file_path):
+    """Return the SHA-256 hex digest of a file's content."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class AnalysisCache(JsonStore):
+    """On-disk cache of analyze-only statistics keyed by file content hash."""
+    description = "analysis cache"
+    
+    def __init__(self, version, cache_dir=None, max_entries=MAX_ENTRIES):
+        self.version = version
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        self.cache_file = os.path.join(self.cache_dir, CACHE_FILE_NAME)
+        super().__init__(self.cache_file, max_entries)
+        self.load()
+    
+    def load(self):
+        """Load the cache file, discarding it if it was written by another version."""
+        data = self.read()
+        if data is None:
+            return
+        
+        # Anything else than the layout to_json writes is replaced on the next save
+        if data.get('version') != self.version or not isinstance(data.get('entries'), dict):
+            self.dirty = True
+            return
+        
+        self.entries = data['entries']
+    
+    def key_for_file(self, file_path):
+        """Return the cache key for a file's current content."""
+        return hash_file(file_path)
+    
+    def get(self, key):
+        """Return the cached statistics for a key, or None on a miss."""
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        
+        # Move the entry to the end so it is evicted last; a hit alone doesn't rewrite the file,
+        # so the new order is saved along with the next new entry
+        self.entries[key] = self.entries.pop(key)
+        return entry
+    
+    def to_json(self):
+        return {'version': self.version, 'entries': self.entries}
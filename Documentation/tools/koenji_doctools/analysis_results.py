@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+import sys
+from collections import namedtuple
+
+# Names of the missing-documentation lists, in the order they are reported
+MISSING_KINDS = ('classes', 'methods', 'properties')
+
+# Kind of a single item in each of those lists
+ITEM_KINDS = ('class', 'method', 'property')
+
+# An undocumented declaration to suggest documentation for; its context is read back
+# from the file at offset when the report is written instead of being kept as text
+Suggestion = namedtuple('Suggestion', ['name', 'line', 'offset'])
+
+def coverage_percentage(total_items, documented_items):
+    """Return the share of documented items as a percentage, 0 for a file without items."""
+    return (documented_items / total_items) * 100 if total_items > 0 else 0
+
+class Coverage(namedtuple('Coverage', ['total_items', 'documented_items'])):
+    """Item counts of a file, all that summaries and prioritization need."""
+    __slots__ = ()
+    
+    @property
+    def coverage_percentage(self):
+        return coverage_percentage(self.total_items, self.documented_items)
+    
+    def coverage(self):
+        """Return the item counts, like FileStats.coverage."""
+        return self
+    
+    def to_dict(self):
+        """Return the counts in the JSON layout of earlier versions."""
+        return {
+            'total_items': self.total_items,
+            'documented_items': self.documented_items,
+            'coverage_percentage': self.coverage_percentage
+        }
+    
+    @classmethod
+    def from_dict(cls, data):
+        """Build counts from a dictionary written by to_dict or by an earlier version."""
+        return cls(data.get('total_items', 0), data.get('documented_items', 0))
+
+class FileStats(namedtuple('FileStats', ['total_items', 'documented_items', 'classes', 'methods', 'properties', 'lines'], defaults=[((), (), ())])):
+    """Documentation statistics of a file, with the names of its undocumented items as tuples of interned strings.
+    
+    lines holds the one-based line of every name, one tuple per list; it is empty for
+    statistics loaded from output that had no line numbers.
+    """
+    __slots__ = ()
+    
+    @property
+    def coverage_percentage(self):
+        return coverage_percentage(self.total_items, self.documented_items)
+    
+    @property
+    def missing_documentation(self):
+        """Return the undocumented names as {'classes': [...], 'methods': [...], 'properties': [...]}."""
+        return {kind: list(getattr(self, kind)) for kind in MISSING_KINDS}
+    
+    @property
+    def missing_lines(self):
+        """Return the lines of the undocumented names, laid out like missing_documentation."""
+        return {kind: list(lines) for kind, lines in zip(MISSING_KINDS, self.lines)}
+    
+    def missing_items(self):
+        """Yield (kind, name, line) for every undocumented item, with None for unknown lines."""
+        for item_kind, kind, lines in zip(ITEM_KINDS, MISSING_KINDS, self.lines):
+            names = getattr(self, kind)
+            for position, name in enumerate(names):
+                yield item_kind, name, lines[position] if position < len(lines) else None
+    
+    def coverage(self):
+        """Return just the item counts."""
+        return Coverage(self.total_items, self.documented_items)
+    
+    def to_dict(self):
+        """Return the statistics in the JSON layout of earlier versions, plus the lines of the undocumented items."""
+        return {
+            'total_items': self.total_items,
+            'documented_items': self.documented_items,
+            'coverage_percentage': self.coverage_percentage,
+            'missing_documentation': self.missing_documentation,
+            'missing_lines': self.missing_lines
+        }
+    
+    @classmethod
+    def from_dict(cls, data):
+        """Build statistics from a dictionary written by to_dict, such as cached or --analyze-only output."""
+        missing = data.get('missing_documentation') or {}
+        lines = data.get('missing_lines') or {}
+        return cls(
+            data.get('total_items', 0),
+            data.get('documented_items', 0),
+            *(tuple(sys.intern(name) for name in missing.get(kind, ())) for kind in MISSING_KINDS),
+            tuple(tuple(lines.get(kind, ())) for kind in MISSING_KINDS)
+        )
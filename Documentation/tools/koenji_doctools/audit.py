@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+import os
+import sys
+
+from .analysis_cache import AnalysisCache
+from .report_writer import ReportWriter, ReportFile
+from .file_discovery import find_swift_files, stream_swift_files
+from .pipeline import DetailSpool
+from .analysis_results import FileStats
+from .audit_formats import REPORT_FORMATS, FORMAT_EXTENSIONS, write_audit_report
+from .sharding import parse_shard, shard_name, select_shard, write_partial_results
+from .scheduling import TimingHistory, DEFAULT_TIME_BUDGET, add_time_budget_argument
+from .profiler import get_profiler, enable_profiling, add_profile_arguments
+from .generator import DocumentationGenerator, default_jobs
+
+# Configuration
+PROJECT_ROOT = "KoenjiApp"
+OUTPUT_FILE = "documentation_audit.md"
+
+# Report written when no output is given, before the extension of its format
+DEFAULT_REPORT_NAME = "documentation_audit_report"
+
+# Regex patterns for Swift
+SWIFT_METHOD_PATTERN = r'(func|var|let)\s+(\w+)'
+SWIFT_DOC_PATTERN = r'\/\/\/.*'
+
+class DocumentationAudit:
+    def __init__(self, root_dir=None, jobs=None, use_cache=True, time_budget=DEFAULT_TIME_BUDGET, progress=None):
+        self.root_dir = root_dir or os.getcwd()
+        # Stream for progress messages, stdout when None; stderr keeps them out of a report written to stdout
+        self.progress = progress
+        self.jobs = jobs or default_jobs()
+        self.use_cache = use_cache
+        self.swift_files = []
+        self.documentation_stats = {}
+        self.detail_positions = {}
+        self.details = None
+        self.shard = None
+        self.listing_positions = {}
+        self.total_items = 0
+        self.documented_items = 0
+        
+        # Analyze in-process, slowest files first
+        self.generator = DocumentationGenerator(time_budget=time_budget, timings=TimingHistory())
+    
+    def find_swift_files(self, directory=None):
+        """Find all Swift files in the given directory recursively, skipping excluded and ignored folders."""
+        swift_files = find_swift_files(directory or self.root_dir)
+        
+        self.swift_files = swift_files
+        return swift_files
+    
+    def analyze_file(self, file_path):
+        """Analyze a single Swift file for documentation coverage, in this process."""
+        return self.analyze_files([file_path])[file_path]
+    
+    def analyze_files(self, file_paths):
+        """Analyze several Swift files and return their statistics keyed by path."""
+        file_paths = list(file_paths)
+        # A pool only pays off with more files than one worker takes
+        return dict(self.iter_analyze_files(file_paths, jobs=min(self.jobs, len(file_paths))))
+    
+    def iter_analyze_files(self, file_paths, jobs=None):
+        """Yield (path, statistics) pairs in input order as each file finishes."""
+        cache = AnalysisCache(self.generator.cache_version()) if self.use_cache else None
+        results = self.generator.iter_analyze_files(file_paths, analyze_only=True, jobs=self.jobs if jobs is None else jobs, cache=cache)
+        for file_path, result in results:
+            yield file_path, result['stats'] if result else None
+    
+    def run_audit(self, directory=None, shard=None):
+        """Run the documentation audit on all Swift files, or on one (index, count) shard of them."""
+        if directory:
+            self.root_dir = directory
+        
+        if shard:
+            # Every node lists the whole tree so they all split it the same way
+            self.shard = shard
+            selected = select_shard(self.find_swift_files(), self.root_dir, shard)
+            self.listing_positions = {os.path.relpath(file_path, self.root_dir): position for position, file_path in selected}
+            file_paths = [file_path for _, file_path in selected]
+        else:
+            file_paths = stream_swift_files(self.root_dir)
+        
+        for file_path, analysis in self.iter_analyze_files(file_paths):
+            rel_path = os.path.relpath(file_path, self.root_dir)
+            print(f"Analyzing {rel_path}...", file=self.progress)
+            
+            if analysis:
+                self.add_result(rel_path, analysis)
+        
+        # Discovery kept the listing, so this doesn't walk the directory again
+        self.find_swift_files()
+        if shard:
+            print(f"Analyzed {len(file_paths)} of {len(self.swift_files)} Swift files in shard {shard[0]}/{shard[1]}", file=self.progress)
+        else:
+            print(f"Analyzed {len(self.swift_files)} Swift files", file=self.progress)
+        return self.documentation_stats
+    
+    def add_result(self, rel_path, analysis):
+        """Add a file's statistics to the audit, keeping only its counts in memory."""
+        # The undocumented items of each file wait in a temporary file until the report is written
+        if self.details is None:
+            self.details = DetailSpool()
+        
+        self.documentation_stats[rel_path] = analysis.coverage()
+        self.detail_positions[rel_path] = self.details.add(analysis.to_dict())
+        
+        # Update totals
+        self.total_items += analysis.total_items
+        self.documented_items += analysis.documented_items
+    
+    def save_partial_results(self, output_file):
+        """Save the results of a sharded audit for doc_workflow.py merge to combine with the other shards."""
+        entries = (
+            (self.listing_positions[rel_path], rel_path, self.file_stats(rel_path))
+            for rel_path in self.documentation_stats
+        )
+        version = self.generator.cache_version()
+        
+        with get_profiler().phase('write report'):
+            report_file = ReportFile(output_file)
+            with report_file as f:
+                write_partial_results(f, self.shard, version, len(self.swift_files), entries)
+        
+        if report_file.changed:
+            print(f"Partial results written to {output_file}")
+        else:
+            print(f"Partial results unchanged at {output_file}")
+        return output_file
+    
+    def generate_report(self, output_file=None, report_format="markdown"):
+        """Generate a documentation coverage report in markdown, JSON, JSON Lines or SARIF, streaming it to a file or stdout."""
+        if not self.documentation_stats:
+            print("No documentation statistics available. Run audit first.", file=self.progress)
+            return
+        
+        def write(stream):
+            if report_format == "markdown":
+                self.write_report(stream)
+            else:
+                self.write_machine_report(stream, report_format)
+        
+        with get_profiler().phase('write report'):
+            if output_file:
+                report_file = ReportFile(output_file)
+                with report_file as f:
+                    write(f)
+                if report_file.changed:
+                    print(f"Report written to {output_file}")
+                else:
+                    print(f"Report unchanged at {output_file}")
+            else:
+                write(sys.stdout)
+                if report_format == "markdown":
+                    print()
+        
+        return output_file
+    
+    def close(self):
+        """Delete the temporary file holding the undocumented items; the reports can't be written after this."""
+        if self.details is not None:
+            self.details.close()
+            self.details = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+    
+    def file_stats(self, rel_path):
+        """Return the full statistics of an analyzed file, read back from the temporary file."""
+        return FileStats.from_dict(self.details.read(self.detail_positions[rel_path]))
+    
+    def write_machine_report(self, stream, report_format):
+        """Stream the report as JSON, JSON Lines or SARIF, with the file and line of every undocumented item."""
+        files = ((rel_path, self.file_stats(rel_path)) for rel_path in self.documentation_stats)
+        version = self.generator.cache_version()
+        write_audit_report(stream, report_format, files, self.root_dir, version)
+    
+    def write_report(self, stream):
+        """Stream the documentation coverage report to an output."""
+        # Calculate overall statistics
+        coverage_percentage = (self.documented_items / self.total_items * 100) if self.total_items > 0 else 0
+        
+        # Sort files by documentation coverage (ascending)
+        sorted_files = sorted(
+            self.documentation_stats.items(),
+            key=lambda x: x[1].coverage_percentage
+        )
+        
+        report = ReportWriter(stream)
+        report.write_line("# Documentation Audit Report")
+        report.write_line("")
+        report.write_line(f"## Summary")
+        report.write_line("")
+        report.write_line(f"- **Files analyzed:** {len(self.documentation_stats)}")
+        report.write_line(f"- **Total items:** {self.total_items}")
+        report.write_line(f"- **Documented items:** {self.documented_items}")
+        report.write_line(f"- **Overall coverage:** {coverage_percentage:.2f}%")
+        report.write_line("")
+        report.write_line("## Files by Coverage (Lowest to Highest)")
+        report.write_line("")
+        
+        for file_path, stats in sorted_files:
+            coverage = stats.coverage_percentage
+            total = stats.total_items
+            documented = stats.documented_items
+            
+            report.write_line(f"### {file_path}")
+            report.write_line(f"- Coverage: {coverage:.2f}%")
+            report.write_line(f"- Items: {documented}/{total}")
+            report.write_line("")
+            
+            # Add details about missing documentation
+            missing_documentation = self.file_stats(file_path).missing_documentation
+            if missing_documentation:
+                report.write_line("#### Missing Documentation")
+                report.write_line("")
+                
+                for item_type, items in missing_documentation.items():
+                    if items:
+                        report.write_line(f"##### {item_type.title()}")
+                        for item in items:
+                            report.write_line(f"- `{item}`")
+                        report.write_line("")
+
+def main(argv=None, prog=None):
+    import argparse
+    
+    parser = argparse.ArgumentParser(prog=prog, description="Generate a documentation audit report for Swift files")
+    parser.add_argument("directory", nargs="?", default=None, help="Directory to analyze (default: current directory)")
+    parser.add_argument("--output", "-o", default=None, help=f"Output file for the report ('-' for stdout, default: {DEFAULT_REPORT_NAME} with the format's extension)")
+    parser.add_argument("--format", choices=REPORT_FORMATS, default="markdown", help="Report format: markdown, a JSON document, JSON Lines or SARIF (default: markdown)")
+    parser.add_argument("--jobs", "-j", type=int, default=default_jobs(), help="Number of worker processes (default: CPU count)")
+    parser.add_argument("--no-cache", action="store_true", help="Re-analyze every file instead of reusing cached results")
+    add_time_budget_argument(parser)
+    parser.add_argument("--shard", type=parse_shard, metavar="K/N", help="Only audit shard K of N and save partial results for doc_workflow.py merge")
+    add_profile_arguments(parser)
+    
+    args = parser.parse_args(argv)
+    
+    if args.profile:
+        enable_profiling(args.profile_top)
+    
+    # A report written to stdout gets it to itself, so progress goes to stderr
+    progress = sys.stderr if args.output == "-" else None
+    if args.shard:
+        if args.format != "markdown":
+            parser.error("--format applies to the merged report; pass it to doc_workflow.py merge")
+        if args.output == "-":
+            parser.error("partial results of a shard have to be saved to a file")
+    
+    with DocumentationAudit(args.directory, jobs=args.jobs, use_cache=not args.no_cache, time_budget=args.time_budget, progress=progress) as audit:
+        if args.shard:
+            audit.run_audit(shard=args.shard)
+            audit.save_partial_results(args.output or f"{DEFAULT_REPORT_NAME}_{shard_name(args.shard)}.jsonl")
+        else:
+            output = args.output or DEFAULT_REPORT_NAME + FORMAT_EXTENSIONS.get(args.format, ".md")
+            
+            audit.run_audit()
+            audit.generate_report(None if output == "-" else output, args.format)
+    
+    if args.profile:
+        get_profiler().write_summary(sys.stderr, args.profile)
+
+if __name__ == "__main__":
+    main()
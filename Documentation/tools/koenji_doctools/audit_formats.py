@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+import os
+import json
+
+from .analysis_results import ITEM_KINDS, coverage_percentage
+
+# Version of the JSON, JSON Lines and SARIF layouts; the major part changes when fields are removed or renamed
+SCHEMA_VERSION = "1.0"
+
+# Formats an audit report can be written in; markdown is written by the tools themselves
+REPORT_FORMATS = ["markdown", "json", "jsonl", "sarif"]
+
+# File extension of each machine-readable format
+FORMAT_EXTENSIONS = {
+    "json": ".json",
+    "jsonl": ".jsonl",
+    "sarif": ".sarif"
+}
+
+TOOL_NAME = "documentation-audit"
+SARIF_VERSION = "2.1.0"
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+
+# SARIF rule of each kind of undocumented item: (id, what the item is called in messages)
+SARIF_RULES = {
+    "class": ("undocumented-type", "Type"),
+    "method": ("undocumented-method", "Method"),
+    "property": ("undocumented-property", "Property")
+}
+
+class AuditTotals:
+    """Totals of the files written so far, summarized once the last one is out."""
+    def __init__(self):
+        self.files_analyzed = 0
+        self.total_items = 0
+        self.documented_items = 0
+    
+    def add(self, stats):
+        """Count a file's items."""
+        self.files_analyzed += 1
+        self.total_items += stats.total_items
+        self.documented_items += stats.documented_items
+    
+    def to_dict(self):
+        """Return the summary record of the files counted."""
+        return {
+            "files_analyzed": self.files_analyzed,
+            "total_items": self.total_items,
+            "documented_items": self.documented_items,
+            "coverage_percentage": coverage_percentage(self.total_items, self.documented_items)
+        }
+
+def report_header(root, analyzer_version):
+    """Return the fields that identify a report and what produced it."""
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "tool": TOOL_NAME,
+        "analyzer_version": analyzer_version,
+        "root": os.path.abspath(root)
+    }
+
+def file_record(path, stats):
+    """Return a file's counts and the location of each of its undocumented items."""
+    return {
+        "path": path,
+        "total_items": stats.total_items,
+        "documented_items": stats.documented_items,
+        "coverage_percentage": stats.coverage_percentage,
+        "undocumented": [
+            {"kind": kind, "name": name, "line": line}
+            for kind, name, line in stats.missing_items()
+        ]
+    }
+
+def write_audit_report(stream, report_format, files, root, analyzer_version=None):
+    """Stream (path, FileStats) pairs to a JSON, JSON Lines or SARIF report; paths are relative to root."""
+    writers = {
+        "json": write_json_report,
+        "jsonl": write_jsonl_report,
+        "sarif": write_sarif_report
+    }
+    return writers[report_format](stream, files, root, analyzer_version)
+
+def write_json_report(stream, files, root, analyzer_version=None):
+    """Stream a single JSON document, with the summary after the files so nothing has to be held back."""
+    totals = AuditTotals()
+    
+    stream.write("{\n")
+    for key, value in report_header(root, analyzer_version).items():
+        stream.write(f"  {json.dumps(key)}: {json.dumps(value)},\n")
+    
+    stream.write('  "files": [')
+    separator = "\n"
+    for path, stats in files:
+        totals.add(stats)
+        stream.write(separator + "    " + json.dumps(file_record(path, stats)))
+        separator = ",\n"
+    
+    stream.write(f'\n  ],\n  "summary": {json.dumps(totals.to_dict())}\n}}\n')
+    return totals
+
+def write_jsonl_report(stream, files, root, analyzer_version=None):
+    """Stream a header record, one record per file and a summary record, one JSON object per line."""
+    totals = AuditTotals()
+    
+    stream.write(json.dumps({"type": "header", **report_header(root, analyzer_version)}) + "\n")
+    for path, stats in files:
+        totals.add(stats)
+        stream.write(json.dumps({"type": "file", **file_record(path, stats)}) + "\n")
+    
+    stream.write(json.dumps({"type": "summary", **totals.to_dict()}) + "\n")
+    return totals
+
+def sarif_result(path, kind, name, line):
+    """Return the SARIF result for an undocumented item."""
+    from urllib.parse import quote
+    
+    rule_id, label = SARIF_RULES[kind]
+    physical_location = {
+        "artifactLocation": {
+            "uri": quote(path.replace(os.sep, "/")),
+            "uriBaseId": "SRCROOT"
+        }
+    }
+    if line:
+        physical_location["region"] = {"startLine": line}
+    
+    return {
+        "ruleId": rule_id,
+        "ruleIndex": ITEM_KINDS.index(kind),
+        "level": "note",
+        "message": {"text": f"{label} `{name}` has no documentation comment"},
+        "locations": [{"physicalLocation": physical_location}]
+    }
+
+def write_sarif_report(stream, files, root, analyzer_version=None):
+    """Stream a SARIF 2.1.0 log with a result per undocumented item, for code scanning and CI annotations."""
+    # Only SARIF needs file URIs, so the other formats don't load pathlib and urllib
+    from pathlib import Path
+    
+    totals = AuditTotals()
+    
+    driver = {
+        "name": TOOL_NAME,
+        "rules": [
+            {
+                "id": SARIF_RULES[kind][0],
+                "shortDescription": {"text": f"{SARIF_RULES[kind][1]} without a documentation comment"}
+            }
+            for kind in ITEM_KINDS
+        ]
+    }
+    if analyzer_version:
+        driver["version"] = analyzer_version
+    
+    stream.write("{\n")
+    stream.write(f'  "$schema": {json.dumps(SARIF_SCHEMA)},\n')
+    stream.write(f'  "version": {json.dumps(SARIF_VERSION)},\n')
+    stream.write('  "runs": [\n    {\n')
+    stream.write(f'      "tool": {{"driver": {json.dumps(driver)}}},\n')
+    
+    # Result paths are relative to the audited folder
+    base_uri = Path(os.path.abspath(root)).as_uri() + "/"
+    stream.write(f'      "originalUriBaseIds": {{"SRCROOT": {{"uri": {json.dumps(base_uri)}}}}},\n')
+    
+    stream.write('      "results": [')
+    separator = "\n"
+    for path, stats in files:
+        totals.add(stats)
+        for kind, name, line in stats.missing_items():
+            stream.write(separator + "        " + json.dumps(sarif_result(path, kind, name, line)))
+            separator = ",\n"
+    
+    properties = {"schema_version": SCHEMA_VERSION, "summary": totals.to_dict()}
+    stream.write(f'\n      ],\n      "properties": {json.dumps(properties)}\n    }}\n  ]\n}}\n')
+    return totals
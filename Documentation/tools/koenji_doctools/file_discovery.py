@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+import os
+import re
+
+from .profiler import get_profiler
+from .pipeline import prefetch
+
+# Source files the tools analyze and folders whose contents are never documented
+EXTENSIONS_TO_SCAN = [".swift"]
+EXCLUDE_DIRS = ["Preview Content", "Tests", "Test Resources", "Previews"]
+
+# Version control, package manager and build output folders, which can be huge and hold no sources
+BUILD_DIRS = [".git", ".build", ".swiftpm", "build", "DerivedData", "Pods", "Carthage"]
+
+PRUNED_DIRS = frozenset(EXCLUDE_DIRS + BUILD_DIRS)
+
+# Listings already made in this process, keyed by absolute directory
+_listings = {}
+
+def translate_pattern(pattern):
+    """Return (regex, negated, directory_only) for a .gitignore line, or None for blanks and comments."""
+    pattern = pattern.rstrip("\n\r")
+    if not pattern.strip() or pattern.startswith("#"):
+        return None
+    
+    pattern = pattern.rstrip(" ")
+    negated = pattern.startswith("!")
+    if negated:
+        pattern = pattern[1:]
+    elif pattern.startswith("\\"):
+        # "\#" and "\!" match names that start with those characters
+        pattern = pattern[1:]
+    
+    directory_only = pattern.endswith("/")
+    pattern = pattern.rstrip("/")
+    if not pattern:
+        return None
+    
+    # Patterns with a slash before their end are relative to the .gitignore's folder,
+    # the others match a name at any depth below it
+    anchored = "/" in pattern
+    pattern = pattern.lstrip("/")
+    
+    regex = []
+    index = 0
+    while index < len(pattern):
+        character = pattern[index]
+        if pattern.startswith("**/", index):
+            regex.append("(?:.*/)?")
+            index += 3
+            continue
+        if pattern.startswith("**", index):
+            regex.append(".*")
+            index += 2
+            continue
+        
+        if character == "*":
+            regex.append("[^/]*")
+        elif character == "?":
+            regex.append("[^/]")
+        elif character == "[" and "]" in pattern[index + 2:]:
+            end = pattern.index("]", index + 2)
+            body = pattern[index + 1:end]
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            regex.append("[" + body.replace("\\", "\\\\") + "]")
+            index = end
+        elif character == "\\" and index + 1 < len(pattern):
+            index += 1
+            regex.append(re.escape(pattern[index]))
+        else:
+            regex.append(re.escape(character))
+        index += 1
+    
+    prefix = "" if anchored else "(?:.*/)?"
+    return re.compile(prefix + "".join(regex) + r"\Z"), negated, directory_only
+
+def read_ignore_file(file_path):
+    """Return the translated rules of a .gitignore file, or an empty list if it can't be read."""
+    try:
+        with open(file_path, "r", encoding="utf-8", errors="replace") as f:
+            lines = f.readlines()
+    except OSError:
+        return []
+    
+    rules = []
+    for line in lines:
+        rule = translate_pattern(line)
+        if rule:
+            rules.append(rule)
+    return rules
+
+class IgnoreRules:
+    """The .gitignore rules that apply inside a folder, outermost file first."""
+    def __init__(self, groups=()):
+        # Each group is (folder of the .gitignore, its rules)
+        self.groups = tuple(groups)
+    
+    @classmethod
+    def for_directory(cls, directory):
+        """Return the rules that the .gitignore files above a folder apply to it."""
+        directory = os.path.abspath(directory)
+        
+        # Only the .gitignore files of the repository the folder belongs to apply
+        ancestors = []
+        current = directory
+        while not os.path.exists(os.path.join(current, ".git")):
+            parent = os.path.dirname(current)
+            if parent == current:
+                return cls()
+            current = parent
+            ancestors.append(current)
+        
+        rules = cls()
+        for ancestor in reversed(ancestors):
+            rules = rules.child(ancestor)
+        return rules
+    
+    def child(self, directory):
+        """Return the rules for a folder, adding its own .gitignore if it has one."""
+        ignore_file = os.path.join(directory, ".gitignore")
+        if not os.path.isfile(ignore_file):
+            return self
+        
+        rules = read_ignore_file(ignore_file)
+        if not rules:
+            return self
+        return IgnoreRules(self.groups + ((directory, rules),))
+    
+    def ignored(self, path, is_directory):
+        """Return whether a path is ignored; the last matching rule wins, deeper files last."""
+        for base, rules in reversed(self.groups):
+            rel_path = os.path.relpath(path, base).replace(os.sep, "/")
+            if rel_path.startswith("../"):
+                continue
+            
+            for regex, negated, directory_only in reversed(rules):
+                if directory_only and not is_directory:
+                    continue
+                if regex.match(rel_path):
+                    return not negated
+        return False
+
+def iter_swift_files(directory, use_gitignore=True):
+    """Yield the Swift files below a folder in os.walk order, skipping excluded and ignored folders."""
+    rules = IgnoreRules.for_directory(directory) if use_gitignore else IgnoreRules()
+    extensions = tuple(EXTENSIONS_TO_SCAN)
+    
+    # The folder asked for is always scanned, even if it would be pruned from its parent
+    stack = [(directory, rules)]
+    while stack:
+        current, rules = stack.pop()
+        if use_gitignore:
+            rules = rules.child(current)
+        
+        try:
+            with os.scandir(current) as entries:
+                entries = list(entries)
+        except OSError:
+            continue
+        
+        subdirectories = []
+        for entry in entries:
+            try:
+                is_directory = entry.is_dir()
+            except OSError:
+                is_directory = False
+            
+            if is_directory:
+                # Like os.walk, don't descend into symlinked folders
+                if entry.name in PRUNED_DIRS or entry.is_symlink():
+                    continue
+                if rules.groups and rules.ignored(entry.path, True):
+                    continue
+                subdirectories.append(entry.path)
+            elif entry.name.endswith(extensions):
+                if rules.groups and rules.ignored(entry.path, False):
+                    continue
+                yield entry.path
+        
+        # Visit subfolders in listing order after this folder's files
+        for subdirectory in reversed(subdirectories):
+            stack.append((subdirectory, rules))
+
+def find_swift_files(directory, refresh=False):
+    """Return the Swift files below a folder, reusing the listing made earlier in this run."""
+    key = os.path.abspath(directory)
+    if refresh or key not in _listings:
+        with get_profiler().phase('discovery'):
+            _listings[key] = list(iter_swift_files(key))
+    return list(_listings[key])
+
+def stream_swift_files(directory):
+    """Yield the Swift files below a folder while it is still being listed, remembering the listing for later."""
+    key = os.path.abspath(directory)
+    if key in _listings:
+        yield from _listings[key]
+        return
+    
+    # The folder is listed on a background thread, so later stages start on the first files right away
+    listing = []
+    for file_path in get_profiler().iterate('discovery', prefetch(iter_swift_files(key))):
+        listing.append(file_path)
+        yield file_path
+    _listings[key] = listing
@@ -0,0 +1,1066 @@
+#!/usr/bin/env python3
+import os
+import re
+import sys
+import json
+import hashlib
+import io
+import mmap
+import time
+from array import array
+from bisect import bisect_right
+from collections import deque, namedtuple
+from contextlib import contextmanager
+
+from .report_writer import ReportWriter
+from .analysis_results import FileStats, Suggestion
+from .file_discovery import iter_swift_files
+from .pipeline import PIPELINE_DEPTH, FLUSH, prefetch, ordered_merge
+from .profiler import get_profiler, enable_profiling, add_profile_arguments
+from .scheduling import TimingHistory, DEFAULT_TIME_BUDGET, file_size, longest_first, add_time_budget_argument
+
+# Bump whenever a change to the analysis would alter its results
+ANALYZER_VERSION = "3.3"
+
+# Files at least this large are scanned as memory-mapped bytes instead of being read into a str
+MMAP_THRESHOLD = 1024 * 1024
+
+# Largest slice copied at once when counting newlines in a memory-mapped file
+COUNT_CHUNK_SIZE = 1024 * 1024
+
+# Tokens scanned or lines walked between checks of a file's time budget
+BUDGET_CHECK_INTERVAL = 256
+
+# Stretch of source, extended to the end of its line, that the scanner searches for tokens at once;
+# a long run without tokens is searched a window at a time so the time budget is still checked
+SCAN_WINDOW = 256 * 1024
+
+# Kinds of source lines, as far as attaching doc comments to declarations is concerned
+LINE_BLANK, LINE_CODE, LINE_DOC, LINE_COMMENT, LINE_ATTRIBUTE = range(5)
+
+# Start of a line that may be a comment or attribute; every other line is code or blank
+COMMENT_OR_ATTRIBUTE_START = re.compile(r'^[ \t]*[/@]', re.MULTILINE)
+
+# A line holding nothing but attributes, such as `@MainActor` or `@available(iOS 15, *)`
+ATTRIBUTE_LINE = re.compile(r'(?:@\w+(?:\((?:[^()]|\([^()]*\))*\))?\s*)+(?://.*)?')
+
+# A declaration found by the scanner; offset is where its keyword starts
+Declaration = namedtuple('Declaration', ['kind', 'keyword', 'name', 'line', 'documented', 'offset'])
+
+# Source text the scanner compares tokens against. ByteSwiftScanner compares the same
+# characters as UTF-8 bytes, so both sets come from the one table
+ScannerLiterals = namedtuple('ScannerLiterals', [
+    'blanks', 'binding_punctuation', 'member_access', 'underscore', 'quote', 'multiline_quotes',
+    'block_open', 'backslash', 'newline', 'open_paren', 'close_paren', 'alternation', 'no_hashes'
+])
+TEXT_LITERALS = ScannerLiterals(' \t', ',(', '.', '_', '"', '"""', '/*', '\\', '\n', '(', ')', '|', '')
+BYTE_LITERALS = ScannerLiterals(*(text.encode('utf-8') for text in TEXT_LITERALS))
+
+class AnalysisBudgetExceeded(Exception):
+    """Raised when analyzing a single file takes longer than its time budget."""
+
+def default_jobs():
+    """Return the default number of worker processes for batch analysis."""
+    return os.cpu_count() or 1
+
+class DocCommentTracker:
+    """Classifies lines in file order and tracks the doc comment attached to the line that follows.
+    
+    A doc comment is a `///` line or a `/** */` block. It stays attached across attribute
+    and ordinary comment lines, and a blank line or code detaches it.
+    """
+    def __init__(self):
+        # Nesting depth of the /* */ comment being read, and whether it is a doc block
+        self.depth = 0
+        self.block_kind = LINE_COMMENT
+        
+        # Number of the next line to classify, and the nearest doc line attached to it or -1
+        self.line = 0
+        self.attached = -1
+    
+    def classify(self, stripped):
+        """Return the kind of the next line, given without surrounding whitespace."""
+        if self.depth:
+            kind = self.block_kind
+        elif not stripped:
+            return LINE_BLANK
+        elif stripped.startswith('///'):
+            return LINE_DOC
+        elif stripped.startswith('/*'):
+            # `/**/` is an empty ordinary comment, not the start of a doc block
+            kind = LINE_DOC if stripped.startswith('/**') and not stripped.startswith('/**/') else LINE_COMMENT
+            self.block_kind = kind
+        elif stripped.startswith('//'):
+            return LINE_COMMENT
+        elif ATTRIBUTE_LINE.fullmatch(stripped):
+            return LINE_ATTRIBUTE
+        else:
+            return LINE_CODE
+        
+        # Swift block comments nest
+        self.depth = max(0, self.depth + stripped.count('/*') - stripped.count('*/'))
+        return kind
+    
+    def skip_to(self, line):
+        """Move to a later line, treating the lines skipped as code or blank."""
+        if line > self.line:
+            self.line = line
+            self.attached = -1
+    
+    def feed(self, text):
+        """Classify the next line and return the doc line attached to the line after it, or -1."""
+        stripped = text.strip()
+        
+        # Most lines are code or blank, which only comments and attributes can't start with
+        if not self.depth and stripped[:1] not in ('/', '@'):
+            self.attached = -1
+        else:
+            kind = self.classify(stripped)
+            if kind == LINE_DOC:
+                self.attached = self.line
+            elif kind in (LINE_BLANK, LINE_CODE):
+                self.attached = -1
+        
+        self.line += 1
+        return self.attached
+
+class LineIndex:
+    """Newline offsets and split lines for a file, built once per analysis.
+    
+    check, if given, is called every BUDGET_CHECK_INTERVAL lines of the loops over the file.
+    """
+    def __init__(self, content, check=None):
+        self.content = content
+        self.lines = content.split('\n')
+        self.check = check
+        
+        # Nearest attached doc line for every line, built the first time it is needed
+        self.attached_docs = None
+        
+        # Offset of the first character of every line
+        self.line_starts = [0]
+        position = content.find('\n')
+        while position != -1:
+            self.line_starts.append(position + 1)
+            position = content.find('\n', position + 1)
+            if check and not len(self.line_starts) % BUDGET_CHECK_INTERVAL:
+                check()
+    
+    def line_of(self, offset):
+        """Return the zero-based line number containing the given offset."""
+        return bisect_right(self.line_starts, offset) - 1
+    
+    def line_range(self, start, end):
+        """Return the text of lines start to end - 1."""
+        return self.lines[start:end]
+    
+    def attached_doc(self, line):
+        """Return the nearest doc comment line attached to a declaration on a line, or -1."""
+        if self.attached_docs is None:
+            self.attached_docs = self._attached_doc_table()
+        return self.attached_docs[line]
+    
+    def _attached_doc_table(self):
+        """Return the doc line attached to every line, classifying only lines that could be comments or attributes."""
+        # Entry n is the doc line attached to line n; lines after code or blank lines keep -1
+        table = array('i', [-1]) * (len(self.lines) + 1)
+        tracker = DocCommentTracker()
+        check = self.check
+        
+        for count, match in enumerate(COMMENT_OR_ATTRIBUTE_START.finditer(self.content), 1):
+            if check and not count % BUDGET_CHECK_INTERVAL:
+                check()
+            
+            line = self.line_of(match.start())
+            if line < tracker.line:
+                # Already read as part of a block comment
+                continue
+            
+            tracker.skip_to(line)
+            table[line + 1] = tracker.feed(self.lines[line])
+            
+            # Lines inside a block comment don't have to start with a slash
+            while tracker.depth and tracker.line < len(self.lines):
+                # feed() advances tracker.line, so take the line number before it does
+                line = tracker.line
+                table[line + 1] = tracker.feed(self.lines[line])
+                if check and not line % BUDGET_CHECK_INTERVAL:
+                    check()
+        
+        return table
+
+class MappedLineIndex:
+    """Line lookups over a memory-mapped file that only keep track of the last line looked up.
+    
+    Lookups are cheapest when they move forward through the file, as they do during a scan;
+    lines are only decoded when their text is asked for. check, if given, is called every
+    BUDGET_CHECK_INTERVAL lines walked for doc comments.
+    """
+    def __init__(self, content, check=None):
+        self.content = content
+        self.check = check
+        
+        # Number and starting offset of the most recently looked up line
+        self.line = 0
+        self.line_start = 0
+        
+        # Doc comments are tracked as lookups move forward instead of keeping a table per line
+        self.tracker = DocCommentTracker()
+    
+    def line_of(self, offset):
+        """Return the zero-based line number containing the given offset."""
+        line_start = self.content.rfind(b'\n', 0, offset) + 1
+        if line_start > self.line_start:
+            self.line += self._count_newlines(self.line_start, line_start)
+        elif line_start < self.line_start:
+            self.line -= self._count_newlines(line_start, self.line_start)
+        
+        self.line_start = line_start
+        return self.line
+    
+    def line_range(self, start, end):
+        """Return the text of lines start to end - 1, walking from the last line looked up."""
+        return list(self.iter_lines(start, end))
+    
+    def iter_lines(self, start, end):
+        """Yield the text of lines start to end - 1, walking from the last line looked up."""
+        content = self.content
+        line = self.line
+        position = self.line_start
+        
+        while line > start:
+            position = content.rfind(b'\n', 0, position - 1) + 1
+            line -= 1
+        while line < start:
+            newline = content.find(b'\n', position)
+            if newline == -1:
+                return
+            position = newline + 1
+            line += 1
+        
+        while line < end:
+            newline = content.find(b'\n', position)
+            stop = len(content) if newline == -1 else newline
+            # Match the universal newline handling of a file opened in text mode
+            yield content[position:stop].decode('utf-8').removesuffix('\r')
+            if newline == -1:
+                break
+            position = newline + 1
+            line += 1
+    
+    def attached_doc(self, line):
+        """Return the nearest doc comment line attached to a declaration on a line, or -1."""
+        # Declarations are looked up in file order, so each line is usually classified once
+        if line < self.tracker.line:
+            self.tracker = DocCommentTracker()
+        for text in self.iter_lines(self.tracker.line, line):
+            self.tracker.feed(text)
+            if self.check and not self.tracker.line % BUDGET_CHECK_INTERVAL:
+                self.check()
+        return self.tracker.attached
+    
+    def _count_newlines(self, start, end):
+        """Count the newlines between two offsets, copying at most one chunk at a time."""
+        count = 0
+        for chunk_start in range(start, end, COUNT_CHUNK_SIZE):
+            count += self.content[chunk_start:min(end, chunk_start + COUNT_CHUNK_SIZE)].count(b'\n')
+        return count
+
+def line_index_for(content, check=None):
+    """Return the line index suited to a file's content, text or memory-mapped bytes."""
+    return LineIndex(content, check) if isinstance(content, str) else MappedLineIndex(content, check)
+
+class SwiftScanner:
+    """Single-pass lexer that finds declarations outside comments and string literals."""
+    # Declaration keywords and the kind of item each one introduces
+    keyword_kinds = {
+        'class': 'class',
+        'struct': 'class',
+        'enum': 'class',
+        'protocol': 'class',
+        'extension': 'extension',
+        'func': 'method',
+        'let': 'property',
+        'var': 'property'
+    }
+    
+    # Words that turn a following let/var into a pattern binding rather than a property
+    binding_words = {'if', 'guard', 'while', 'case', 'catch'}
+    
+    # Words that can follow `class` when it is a modifier (`class func`, `class var`)
+    class_modifier_words = {'func', 'var', 'let', 'override', 'final', 'static', 'subscript'}
+    
+    token_pattern = re.compile(r'''
+        (?P<comment>//[^\n]*)
+      | (?P<block>/\*)
+      | (?P<string>(?P<hashes>\#*)(?P<quotes>"""|"))
+      | (?P<keyword>\b(?:class|struct|enum|protocol|extension|func|let|var)\b)
+    ''', re.VERBOSE)
+    name_pattern = re.compile(r'[ \t]+(`?)(\w+)\1')
+    block_pattern = re.compile(r'/\*|\*/')
+    interpolation_pattern = re.compile(r'[()"]')
+    
+    # Characters the source is compared against, as text
+    literals = TEXT_LITERALS
+    
+    def __init__(self):
+        # String-body patterns compiled per delimiter (number of #s, single or multi-line)
+        self.string_patterns = {}
+    
+    def scan(self, content, check=None):
+        """Yield (keyword, name, offset) for every declaration in the file.
+        
+        check, if given, is called every BUDGET_CHECK_INTERVAL tokens and after every
+        SCAN_WINDOW of source without any, so a caller can stop a scan that runs too long.
+        """
+        length = len(content)
+        position = 0
+        count = 0
+        newline = self.literals.newline
+        multiline_quotes = self.literals.multiline_quotes
+        
+        while position < length:
+            # Tokens never span lines, so searching up to the end of a line can't cut one off
+            end = content.find(newline, position + SCAN_WINDOW) + 1 or length
+            match = self.token_pattern.search(content, position, end)
+            if not match:
+                position = end
+                if check:
+                    check()
+                continue
+            
+            count += 1
+            if check and not count % BUDGET_CHECK_INTERVAL:
+                check()
+            
+            token = match.lastgroup
+            position = match.end()
+            
+            if token == 'block':
+                position = self._skip_block_comment(content, position)
+            elif token == 'string':
+                position = self._skip_string(content, position, match.group('hashes'), match.group('quotes') == multiline_quotes)
+            elif token == 'keyword':
+                declaration = self._read_declaration(content, match)
+                if declaration:
+                    yield declaration
+    
+    def _read_declaration(self, content, match):
+        """Return (keyword, name, offset) if the keyword starts a tracked declaration."""
+        keyword = self._text(match.group('keyword'))
+        start = match.start()
+        
+        # Member accesses such as `.class` are not declarations
+        if start > 0 and content[start - 1:start] == self.literals.member_access:
+            return None
+        
+        name_match = self.name_pattern.match(content, match.end())
+        if not name_match:
+            return None
+        name = self._text(name_match.group(2))
+        
+        if keyword == 'class' and name in self.class_modifier_words:
+            return None
+        
+        if keyword in ('let', 'var') and self._is_pattern_binding(content, start):
+            return None
+        
+        return keyword, name, start
+    
+    def _is_pattern_binding(self, content, position):
+        """Check whether a let/var keyword binds a pattern, as in `if let` or `case (let a, let b)`."""
+        end = position
+        while end > 0 and content[end - 1:end] in self.literals.blanks:
+            end -= 1
+        if end > 0 and content[end - 1:end] in self.literals.binding_punctuation:
+            return True
+        
+        start = end
+        while start > 0 and self._is_identifier_character(content[start - 1:start]):
+            start -= 1
+        return self._text(content[start:end]) in self.binding_words
+    
+    def _is_identifier_character(self, character):
+        """Check whether a character can be part of an identifier."""
+        return character.isalnum() or character == self.literals.underscore
+    
+    def _text(self, value):
+        """Return a piece of source as text."""
+        return value
+    
+    def _skip_block_comment(self, content, position):
+        """Return the offset just past a (possibly nested) block comment."""
+        depth = 1
+        while depth:
+            match = self.block_pattern.search(content, position)
+            if not match:
+                return len(content)
+            depth += 1 if match.group() == self.literals.block_open else -1
+            position = match.end()
+        return position
+    
+    def _skip_string(self, content, position, hashes, multiline):
+        """Return the offset just past a string literal whose body starts at position."""
+        pattern = self._string_pattern(hashes, multiline)
+        escape = self.literals.backslash + hashes
+        
+        while True:
+            match = pattern.search(content, position)
+            if not match:
+                return len(content)
+            
+            position = match.end()
+            token = match.group()
+            if token == self.literals.newline:
+                # Unterminated single-line string; resume scanning on the next line
+                return position
+            if token != escape:
+                return position
+            
+            # Escapes either interpolate an expression or consume the next character
+            if content[position:position + 1] == self.literals.open_paren:
+                position = self._skip_interpolation(content, position + 1)
+            else:
+                position += 1
+    
+    def _string_pattern(self, hashes, multiline):
+        """Return the pattern matching the tokens that matter inside a string body."""
+        key = (hashes, multiline)
+        if key not in self.string_patterns:
+            literals = self.literals
+            terminator = (literals.multiline_quotes if multiline else literals.quote) + hashes
+            alternatives = [re.escape(literals.backslash + hashes), re.escape(terminator)]
+            if not multiline:
+                alternatives.append(literals.newline)
+            self.string_patterns[key] = re.compile(literals.alternation.join(alternatives))
+        return self.string_patterns[key]
+    
+    def _skip_interpolation(self, content, position):
+        """Return the offset just past a string interpolation's closing parenthesis."""
+        depth = 1
+        while depth:
+            match = self.interpolation_pattern.search(content, position)
+            if not match:
+                return len(content)
+            
+            position = match.end()
+            token = match.group()
+            if token == self.literals.open_paren:
+                depth += 1
+            elif token == self.literals.close_paren:
+                depth -= 1
+            else:
+                position = self._skip_string(content, position, self.literals.no_hashes, False)
+        return position
+
+class ByteSwiftScanner(SwiftScanner):
+    """SwiftScanner for UTF-8 bytes, such as a memory-mapped file; only names are decoded."""
+    # Bytes of multi-byte UTF-8 characters count as word characters, like letters do in text
+    token_pattern = re.compile(rb'''
+        (?P<comment>//[^\n]*)
+      | (?P<block>/\*)
+      | (?P<string>(?P<hashes>\#*)(?P<quotes>"""|"))
+      | (?P<keyword>(?<![\w\x80-\xff])(?:class|struct|enum|protocol|extension|func|let|var)(?![\w\x80-\xff]))
+    ''', re.VERBOSE)
+    name_pattern = re.compile(rb'[ \t]+(`?)([\w\x80-\xff]+)\1')
+    block_pattern = re.compile(rb'/\*|\*/')
+    interpolation_pattern = re.compile(rb'[()"]')
+    
+    # The same characters as UTF-8 bytes
+    literals = BYTE_LITERALS
+    
+    def _is_identifier_character(self, character):
+        """Check whether a byte can be part of an identifier."""
+        return character.isalnum() or character == self.literals.underscore or character >= b'\x80'
+    
+    def _text(self, value):
+        """Decode a piece of source."""
+        return value.decode('utf-8')
+
+class DocumentationGenerator:
+    def __init__(self, mmap_threshold=MMAP_THRESHOLD, time_budget=DEFAULT_TIME_BUDGET, timings=None):
+        # Single-pass scanners for Swift declarations in text and in memory-mapped bytes
+        self.scanner = SwiftScanner()
+        self.byte_scanner = ByteSwiftScanner()
+        self.mmap_threshold = mmap_threshold
+        
+        # Seconds a file may take before it is skipped, and when the file being analyzed runs out
+        self.time_budget = time_budget
+        self.deadline = None
+        
+        # Earlier analysis times, used to start the slowest files first and updated with this run's
+        self.timings = timings
+        
+        # Results of the most recent analysis
+        self.suggestions = {
+            'class': [],
+            'method': [],
+            'property': []
+        }
+        self.stats = FileStats(0, 0, (), (), ())
+        
+        # Track classes to avoid duplicates from extensions
+        self.processed_classes = set()
+    
+    def extract_context(self, content, match_start, context_lines=3, index=None):
+        """Extract context around a code declaration."""
+        index = index or line_index_for(content)
+        
+        # Find the line number for the match
+        line_start = index.line_of(match_start)
+        
+        # Extract context lines before and after
+        start_line = max(0, line_start - context_lines)
+        end_line = line_start + context_lines + 1
+        
+        return '\n'.join(index.line_range(start_line, end_line))
+    
+    def has_documentation(self, content, match_start, index=None):
+        """Check if a `///` or `/** */` doc comment is attached to the declaration at match_start."""
+        index = index or line_index_for(content)
+        return index.attached_doc(index.line_of(match_start)) >= 0
+    
+    def scan_declarations(self, content, index=None):
+        """Return every declaration in the file, text or memory-mapped bytes, in source order."""
+        profiler = get_profiler()
+        index = index or line_index_for(content, self.budget_check())
+        scanner = self.scanner if isinstance(content, str) else self.byte_scanner
+        
+        with profiler.phase('scan'):
+            matches = list(scanner.scan(content, self.budget_check()))
+        
+        with profiler.phase('documentation lookback'):
+            return [
+                Declaration(
+                    scanner.keyword_kinds[keyword],
+                    keyword,
+                    sys.intern(name),
+                    index.line_of(offset) + 1,
+                    self.has_documentation(content, offset, index),
+                    offset
+                )
+                for keyword, name, offset in matches
+            ]
+    
+    def budget_check(self):
+        """Return the function long loops call to enforce the file's time budget, or None without a deadline."""
+        return self._check_deadline if self.deadline else None
+    
+    def _check_deadline(self):
+        """Raise AnalysisBudgetExceeded once the file's deadline has passed."""
+        if time.perf_counter() > self.deadline:
+            raise AnalysisBudgetExceeded(f"analysis took longer than the {self.time_budget:g}s time budget")
+    
+    @contextmanager
+    def budgeted(self):
+        """Give the analysis inside the block the per-file time budget."""
+        self.deadline = time.perf_counter() + self.time_budget if self.time_budget else None
+        try:
+            yield
+        finally:
+            self.deadline = None
+    
+    @contextmanager
+    def open_source(self, file_path):
+        """Yield a file's content as a str, or as a read-only memory map of its bytes if it is very large."""
+        with get_profiler().phase('read'):
+            size = os.path.getsize(file_path)
+            if not size or size < self.mmap_threshold:
+                with open(file_path, 'r') as f:
+                    content = f.read()
+        
+        if not size or size < self.mmap_threshold:
+            yield content
+            return
+        
+        # Large files are scanned in place so memory use doesn't grow with their size
+        with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            yield content
+    
+    def analyze_file(self, file_path, analyze_only=False):
+        """Analyze a Swift file and generate documentation suggestions."""
+        with self.open_source(file_path) as content:
+            return self.analyze_content(content, analyze_only)
+    
+    def analyze_content(self, content, analyze_only=False, index=None):
+        """Analyze Swift source, as a str or as UTF-8 bytes, and generate documentation suggestions."""
+        profiler = get_profiler()
+        
+        # Build the line index once and share it across every match
+        if index is None:
+            with profiler.phase('line index'):
+                index = line_index_for(content, self.budget_check())
+        
+        # Reset statistics and suggestions
+        total_items = 0
+        documented_items = 0
+        missing = {
+            'class': [],
+            'method': [],
+            'property': []
+        }
+        missing_lines = {
+            'class': [],
+            'method': [],
+            'property': []
+        }
+        
+        self.suggestions = {
+            'class': [],
+            'method': [],
+            'property': []
+        }
+        
+        self.processed_classes = set()
+        
+        declarations = self.scan_declarations(content, index)
+        
+        with profiler.phase('collect results'):
+            for declaration in declarations:
+                if declaration.kind == 'extension':
+                    continue
+                
+                # Count each class, struct, enum or protocol name only once
+                if declaration.kind == 'class':
+                    if declaration.name in self.processed_classes:
+                        continue
+                    self.processed_classes.add(declaration.name)
+                
+                total_items += 1
+                
+                if declaration.documented:
+                    documented_items += 1
+                else:
+                    # Suggestions keep the declaration's position; the context is extracted when the report is written
+                    if not analyze_only:
+                        self.suggestions[declaration.kind].append(Suggestion(declaration.name, declaration.line, declaration.offset))
+                    missing[declaration.kind].append(declaration.name)
+                    missing_lines[declaration.kind].append(declaration.line)
+        
+        self.stats = FileStats(
+            total_items,
+            documented_items,
+            tuple(missing['class']),
+            tuple(missing['method']),
+            tuple(missing['property']),
+            (tuple(missing_lines['class']), tuple(missing_lines['method']), tuple(missing_lines['property']))
+        )
+        return self.suggestions, self.stats
+    
+    def cache_version(self):
+        """Return a version string that changes whenever the analysis could change."""
+        digest = hashlib.sha256(self.scanner.token_pattern.pattern.encode() + self.byte_scanner.token_pattern.pattern).hexdigest()
+        return f"{ANALYZER_VERSION}-{digest[:16]}"
+    
+    def analyze_files(self, file_paths, analyze_only=True, jobs=1, cache=None):
+        """Analyze several Swift files and return their results keyed by path."""
+        file_paths = list(file_paths)
+        return dict(self.iter_analyze_files(file_paths, analyze_only, min(jobs, len(file_paths)), cache))
+    
+    def iter_analyze_files(self, file_paths, analyze_only=True, jobs=1, cache=None):
+        """Yield (path, result) pairs in input order as each file finishes."""
+        # Only analyze-only statistics are cached; suggestions need fresh context
+        if cache is not None and analyze_only:
+            yield from self._iter_analyze_files_cached(file_paths, jobs, cache)
+            return
+        
+        yield from self._iter_scheduled(file_paths, jobs, _analyze_in_worker, self._analyze_one, analyze_only)
+    
+    def _iter_analyze_files_cached(self, file_paths, jobs, cache):
+        """Analyze files in analyze-only mode, reusing cached statistics for unchanged content."""
+        # Keys of the files being analyzed, so their statistics can be cached once they finish
+        keys = {}
+        
+        def lookup(file_path):
+            try:
+                with get_profiler().phase('cache lookup'):
+                    key = cache.key_for_file(file_path)
+            except OSError:
+                # Let the normal analysis report the error
+                key = None
+            
+            stats = cache.get(key) if key else None
+            if stats is None:
+                keys[file_path] = key
+                return None
+            return {
+                'stats': FileStats.from_dict(stats),
+                'suggestions': {'class': [], 'method': [], 'property': []}
+            }
+        
+        def analyze(misses):
+            return self.iter_analyze_files(misses, analyze_only=True, jobs=jobs)
+        
+        try:
+            for file_path, result, cached in ordered_merge(file_paths, lookup, analyze):
+                # Remember the statistics of the misses for the next run
+                if not cached:
+                    key = keys.pop(file_path)
+                    if result and key:
+                        cache.put(key, result['stats'].to_dict())
+                yield file_path, result
+        finally:
+            with get_profiler().phase('cache save'):
+                cache.save()
+    
+    def _iter_scheduled(self, file_paths, jobs, worker, run_one, *args):
+        """Yield (path, result) pairs in input order, recording how long each file took.
+        
+        Worker processes are given the files expected to take longest first, from earlier
+        timings or file sizes, so a few large files don't start last and hold up the run.
+        """
+        try:
+            if jobs > 1:
+                results = _profiled_pool_map(worker, file_paths, jobs, *args, self.time_budget, cost=self.estimate_time)
+                for file_path, result, seconds in results:
+                    if file_path is not FLUSH:
+                        self.record_time(file_path, seconds)
+                    yield file_path, result
+                return
+            
+            for file_path in file_paths:
+                # Nothing is held back here, so an ordered_merge flush is answered right away
+                if file_path is FLUSH:
+                    yield FLUSH, None
+                    continue
+                
+                started = time.perf_counter()
+                result = run_one(file_path, *args)
+                self.record_time(file_path, time.perf_counter() - started)
+                yield file_path, result
+        finally:
+            if self.timings is not None:
+                self.timings.save()
+    
+    def estimate_time(self, file_path):
+        """Return how long a file is expected to take, from earlier timings or its size."""
+        if self.timings is not None:
+            return self.timings.estimate(file_path)
+        return file_size(file_path)
+    
+    def record_time(self, file_path, seconds):
+        """Remember how long a file took for scheduling later runs."""
+        if self.timings is not None:
+            self.timings.record(file_path, seconds)
+    
+    def run_budgeted(self, file_path, analyze, *args, **kwargs):
+        """Return analyze(file_path, ...) run within the file's time budget, or None if the file can't be read or runs out of time."""
+        try:
+            with self.budgeted():
+                return analyze(file_path, *args, **kwargs)
+        except AnalysisBudgetExceeded as e:
+            # Flag the file instead of letting it stall the run
+            print(f"Skipped {file_path}: {e}", file=sys.stderr)
+        except (OSError, UnicodeDecodeError) as e:
+            # Keep going so one unreadable file doesn't abort the whole batch
+            print(f"Error analyzing {file_path}: {e}", file=sys.stderr)
+        return None
+    
+    def _analyze_one(self, file_path, analyze_only):
+        """Analyze a single file, returning None if it can't be read or runs out of time."""
+        with get_profiler().track_file(file_path):
+            analysis = self.run_budgeted(file_path, self.analyze_file, analyze_only=analyze_only)
+        if analysis is None:
+            return None
+        
+        suggestions, stats = analysis
+        return {
+            'stats': stats,
+            'suggestions': suggestions
+        }
+    
+    def generate_documentation_reports(self, file_paths, jobs=1):
+        """Generate documentation reports for several Swift files keyed by path."""
+        file_paths = list(file_paths)
+        return dict(self.iter_documentation_reports(file_paths, min(jobs, len(file_paths))))
+    
+    def iter_documentation_reports(self, file_paths, jobs=1):
+        """Yield (path, report) pairs in input order as each file finishes."""
+        yield from self._iter_scheduled(file_paths, jobs, _report_in_worker, self._report_one)
+    
+    def iter_analysis_reports(self, file_paths, jobs=1):
+        """Yield (path, (stats, report)) pairs in input order, analyzing each file once for both."""
+        yield from self._iter_scheduled(file_paths, jobs, _analysis_report_in_worker, self._analysis_report_one)
+    
+    def _analysis_report_one(self, file_path):
+        """Analyze a single file and render its report while it is open, returning None if it can't be read or runs out of time."""
+        output = io.StringIO()
+        stats = self.stream_documentation_report(file_path, output)
+        return (stats, output.getvalue()) if stats is not None else None
+    
+    def stream_documentation_report(self, file_path, *streams):
+        """Stream a report within the time budget and return its statistics, or None if the file can't be read or runs out of time."""
+        return self.run_budgeted(file_path, self.write_documentation_report, *streams)
+    
+    def _report_one(self, file_path):
+        """Generate a single report, returning None if the file can't be read or runs out of time."""
+        return self.run_budgeted(file_path, self.generate_documentation_report)
+    
+    def generate_documentation_report(self, file_path):
+        """Generate a documentation report for a Swift file."""
+        output = io.StringIO()
+        self.write_documentation_report(file_path, output)
+        return output.getvalue()
+    
+    def write_documentation_report(self, file_path, *streams):
+        """Stream a documentation report for a Swift file to the given outputs and return its statistics."""
+        with get_profiler().track_file(file_path), self.open_source(file_path) as content:
+            with get_profiler().phase('line index'):
+                index = line_index_for(content, self.budget_check())
+            suggestions, stats = self.analyze_content(content, index=index)
+            self.write_suggestions(file_path, suggestions, *streams, content=content, index=index)
+        return stats
+    
+    def write_suggestions(self, file_path, suggestions, *streams, content=None, index=None):
+        """Stream the documentation report for suggestions that were already collected.
+        
+        The context of each suggestion is read from content, or from the file when no content is given.
+        """
+        with get_profiler().phase('write report'):
+            if content is not None or not any(suggestions.values()):
+                self._write_suggestions(file_path, suggestions, ReportWriter(*streams), content, index)
+                return
+            
+            with self.open_source(file_path) as content:
+                self._write_suggestions(file_path, suggestions, ReportWriter(*streams), content, line_index_for(content))
+    
+    def _write_suggestions(self, file_path, suggestions, report, content, index):
+        """Write the report sections for a file's suggestions."""
+        file_name = os.path.basename(file_path)
+        report.write_line(f"# Documentation Suggestions for {file_name}\n")
+        report.write_line(f"File: {file_path}")
+        
+        total_suggestions = sum(len(suggestions[key]) for key in suggestions)
+        report.write_line(f"Total suggestions: {total_suggestions}\n")
+        
+        # Add class documentation suggestions
+        if suggestions['class']:
+            report.write_line(f"## Class Documentation ({len(suggestions['class'])})\n")
+            for i, suggestion in enumerate(suggestions['class']):
+                report.write_line(f"### {suggestion.name} (Line {suggestion.line})\n")
+                report.write_line("**Context:**\n")
+                report.write_line(f"```swift\n{self.extract_context(content, suggestion.offset, index=index)}\n```\n")
+                report.write_line("**Suggested Documentation:**\n")
+                report.write_line(f"```swift\n/// {suggestion.name} {self._get_type_name(suggestion.name)}.\n///\n/// [Add a description of what this {self._get_type_name(suggestion.name)} does and its responsibilities]\n```\n")
+        
+        # Add method documentation suggestions
+        if suggestions['method']:
+            report.write_line(f"## Method Documentation ({len(suggestions['method'])})\n")
+            for i, suggestion in enumerate(suggestions['method']):
+                report.write_line(f"### {suggestion.name} (Line {suggestion.line})\n")
+                report.write_line("**Context:**\n")
+                report.write_line(f"```swift\n{self.extract_context(content, suggestion.offset, index=index)}\n```\n")
+                report.write_line("**Suggested Documentation:**\n")
+                report.write_line(f"```swift\n/// [Add a description of what the {suggestion.name} method does]\n///\n/// - Parameters:\n///   - [parameter]: [Description of parameter]\n/// - Returns: [Description of the return value]\n```\n")
+        
+        # Add property documentation suggestions
+        if suggestions['property']:
+            report.write_line(f"## Property Documentation ({len(suggestions['property'])})\n")
+            for i, suggestion in enumerate(suggestions['property']):
+                report.write_line(f"### {suggestion.name} (Line {suggestion.line})\n")
+                report.write_line("**Context:**\n")
+                report.write_line(f"```swift\n{self.extract_context(content, suggestion.offset, index=index)}\n```\n")
+                report.write_line("**Suggested Documentation:**\n")
+                report.write_line(f"```swift\n/// [Description of the {suggestion.name} property]\n```\n")
+        
+        report.write_line(f"\nTotal documentation suggestions: {total_suggestions}\n")
+    
+    def _get_type_name(self, name):
+        """Guess the type name based on naming conventions."""
+        if name.endswith('Controller'):
+            return 'controller'
+        elif name.endswith('Service'):
+            return 'service'
+        elif name.endswith('Manager'):
+            return 'manager'
+        elif name.endswith('View'):
+            return 'view'
+        elif name.endswith('ViewModel'):
+            return 'view model'
+        else:
+            return 'class'
+
+# Generator reused by every task a worker process runs
+_worker_generator = None
+
+def _get_worker_generator():
+    """Return this worker process's generator, creating it on first use."""
+    global _worker_generator
+    if _worker_generator is None:
+        _worker_generator = DocumentationGenerator()
+    return _worker_generator
+
+def _run_in_worker(profile, time_budget, run_one, *args):
+    """Run one file's work in a worker process, returning its result, timings and duration."""
+    if profile:
+        enable_profiling(profile)
+    generator = _get_worker_generator()
+    generator.time_budget = time_budget
+    
+    started = time.perf_counter()
+    result = run_one(generator, *args)
+    return result, get_profiler().drain(), time.perf_counter() - started
+
+def _analyze_in_worker(file_path, analyze_only, time_budget=DEFAULT_TIME_BUDGET, profile=0):
+    """Analyze a single file inside a worker process, returning the result, its timings and duration."""
+    return _run_in_worker(profile, time_budget, DocumentationGenerator._analyze_one, file_path, analyze_only)
+
+def _report_in_worker(file_path, time_budget=DEFAULT_TIME_BUDGET, profile=0):
+    """Generate a single report inside a worker process, returning the report, its timings and duration."""
+    return _run_in_worker(profile, time_budget, DocumentationGenerator._report_one, file_path)
+
+def _analysis_report_in_worker(file_path, time_budget=DEFAULT_TIME_BUDGET, profile=0):
+    """Analyze a single file and render its report inside a worker process, returning both, its timings and duration."""
+    return _run_in_worker(profile, time_budget, DocumentationGenerator._analysis_report_one, file_path)
+
+def _profiled_pool_map(function, items, jobs, *args, cost=None):
+    """Run a worker function over items in input order, yielding (item, result, seconds) and merging the timings workers send back."""
+    # Workers profile themselves only when this process does, keeping as many slowest files
+    profiler = get_profiler()
+    results = _ordered_pool_map(function, items, jobs, *args, profiler.slowest, cost=cost)
+    for item, outcome in profiler.iterate('wait for workers', results):
+        if item is FLUSH:
+            yield FLUSH, None, 0
+            continue
+        
+        result, profile, seconds = outcome
+        profiler.merge(profile)
+        yield item, result, seconds
+
+def _ordered_pool_map(function, items, jobs, *args, cost=None):
+    """Run a function over items in a process pool, yielding (item, result) pairs in input order.
+    
+    Items are taken a window at a time; with a cost function, each window is submitted
+    most expensive first so the slowest items aren't the last ones left running. An
+    ordered_merge FLUSH ends the window early, and (FLUSH, None) is yielded once every
+    item before it has been.
+    """
+    # Loading multiprocessing takes longer than a small single-process run, so only pools pay for it
+    from concurrent.futures import ProcessPoolExecutor
+    
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        # The next window is submitted before waiting on the previous one, so workers
+        # never run dry between windows while at most two windows of results are held
+        items = iter(items)
+        pending = deque()
+        while True:
+            window = []
+            flush = False
+            for item in items:
+                if item is FLUSH:
+                    flush = True
+                    break
+                window.append(item)
+                if len(window) == PIPELINE_DEPTH:
+                    break
+            if not window and not flush:
+                break
+            
+            if window:
+                order = longest_first(range(len(window)), lambda position: cost(window[position])) if cost else range(len(window))
+                futures = {position: executor.submit(function, window[position], *args) for position in order}
+                pending.append([(item, futures[position]) for position, item in enumerate(window)])
+            
+            if flush:
+                while pending:
+                    for item, future in pending.popleft():
+                        yield item, future.result()
+                yield FLUSH, None
+            elif len(pending) > 1:
+                for item, future in pending.popleft():
+                    yield item, future.result()
+        
+        while pending:
+            for item, future in pending.popleft():
+                yield item, future.result()
+
+def analyze_directory_ndjson(generator, directory, jobs=1):
+    """Stream one JSON object per Swift file in a directory, followed by a summary record."""
+    files_analyzed = 0
+    files_failed = 0
+    total_items = 0
+    documented_items = 0
+    
+    swift_files = get_profiler().iterate('discovery', prefetch(iter_swift_files(str(directory))))
+    for file_path, result in generator.iter_analyze_files(swift_files, analyze_only=True, jobs=jobs):
+        stats = result['stats'] if result else None
+        print(json.dumps({'type': 'file', 'path': file_path, 'stats': stats.to_dict() if stats else None}), flush=True)
+        
+        if stats is None:
+            files_failed += 1
+            continue
+        
+        files_analyzed += 1
+        total_items += stats.total_items
+        documented_items += stats.documented_items
+    
+    print(json.dumps({
+        'type': 'summary',
+        'files_analyzed': files_analyzed,
+        'files_failed': files_failed,
+        'total_items': total_items,
+        'documented_items': documented_items,
+        'coverage_percentage': (documented_items / total_items * 100) if total_items > 0 else 0
+    }), flush=True)
+
+def main(argv=None, prog=None):
+    import argparse
+    
+    parser = argparse.ArgumentParser(prog=prog, description='Generate documentation suggestions for Swift files')
+    parser.add_argument('path', help='Path to a Swift file or directory')
+    parser.add_argument('--analyze-only', action='store_true', help='Only analyze and output JSON statistics (one JSON object per line for a directory)')
+    parser.add_argument('--jobs', '-j', type=int, default=default_jobs(), help='Number of worker processes for directories (default: CPU count)')
+    add_time_budget_argument(parser)
+    add_profile_arguments(parser)
+    args = parser.parse_args(argv)
+    
+    if args.profile:
+        enable_profiling(args.profile_top)
+    
+    try:
+        run(args)
+    finally:
+        if args.profile:
+            get_profiler().write_summary(sys.stderr, args.profile)
+
+def run(args):
+    """Analyze the file or directory given on the command line."""
+    from pathlib import Path
+    
+    path = Path(args.path)
+    
+    # Directories remember each file's analysis time to schedule the slowest files first next time
+    generator = DocumentationGenerator(time_budget=args.time_budget, timings=TimingHistory() if path.is_dir() else None)
+    
+    if path.is_file() and path.suffix == '.swift':
+        if args.analyze_only:
+            _, stats = generator.analyze_file(path, analyze_only=True)
+            print(json.dumps(stats.to_dict()))
+        else:
+            print(f"Analyzing {path}...")
+            generator.write_documentation_report(path, sys.stdout)
+            print()
+    elif path.is_dir():
+        if args.analyze_only:
+            analyze_directory_ndjson(generator, path, args.jobs)
+            return
+        
+        swift_files = get_profiler().iterate('discovery', prefetch(iter_swift_files(str(path))))
+        if args.jobs <= 1:
+            # Stream each report straight to stdout as it is generated, skipping files a worker would skip
+            for swift_file in swift_files:
+                print(f"Analyzing {swift_file}...")
+                if generator.stream_documentation_report(swift_file, sys.stdout) is not None:
+                    print()
+            return
+        
+        for swift_file, report in generator.iter_documentation_reports(swift_files, args.jobs):
+            print(f"Analyzing {swift_file}...")
+            if report is not None:
+                print(report)
+    else:
+        print(f"Error: {path} is not a valid Swift file or directory")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main() 
\ No newline at end of file
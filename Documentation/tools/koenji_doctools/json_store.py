@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+import os
+import sys
+import json
+
+class JsonStore:
+    """Entries kept in least-recently-used order, oldest first, and saved to a JSON file when changed.
+    
+    Subclasses load their entries with read() and return the document to save from to_json().
+    """
+    # What the file holds, for error messages
+    description = "data"
+    
+    def __init__(self, path, max_entries):
+        self.path = path
+        self.max_entries = max_entries
+        self.entries = {}
+        self.dirty = False
+    
+    def read(self):
+        """Return the JSON object in the file, None if it can't be read, or {} if it holds anything else."""
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return data if isinstance(data, dict) else {}
+    
+    def put(self, key, value):
+        """Store a value as the most recent entry, evicting the oldest entries when full."""
+        self.entries.pop(key, None)
+        self.entries[key] = value
+        
+        while len(self.entries) > self.max_entries:
+            del self.entries[next(iter(self.entries))]
+        
+        self.dirty = True
+    
+    def to_json(self):
+        """Return the JSON document to save."""
+        raise NotImplementedError
+    
+    def save(self):
+        """Write the file back to disk if anything changed."""
+        if not self.dirty:
+            return
+        
+        # Write to a temporary file first so an interrupted run can't corrupt the file
+        import tempfile
+        directory = os.path.dirname(self.path)
+        temp_path = None
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(self.to_json(), f)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            print(f"Error saving {self.description}: {e}", file=sys.stderr)
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
+            return
+        
+        self.dirty = False
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+import json
+import queue
+import threading
+from collections import deque
+
+# Items a background stage may run ahead of the stage consuming them
+PIPELINE_DEPTH = 256
+
+# Marks the end of a background stage's output
+_DONE = object()
+
+# Sent through a processing stage by ordered_merge to have it yield everything it holds
+FLUSH = object()
+
+# Result of an item ordered_merge is still waiting on
+_PENDING = object()
+
+def prefetch(iterable, depth=PIPELINE_DEPTH):
+    """Run an iterable on a background thread, yielding its items through a bounded queue."""
+    items = queue.Queue(maxsize=depth)
+    stopped = threading.Event()
+    
+    def put(entry):
+        # Give up once the consumer is gone instead of blocking on a full queue forever
+        while not stopped.is_set():
+            try:
+                items.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def produce():
+        try:
+            for item in iterable:
+                if not put((item, None)):
+                    return
+            put((_DONE, None))
+        except BaseException as e:
+            put((_DONE, e))
+    
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item, error = items.get()
+            if item is _DONE:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stopped.set()
+
+def ordered_merge(items, lookup, process, depth=PIPELINE_DEPTH):
+    """Yield (item, result, looked_up) in input order for items whose result is looked up or computed.
+    
+    lookup(item) returns a ready result or None. The remaining items are streamed
+    through process, which must yield (item, result) pairs in the order it got them.
+    Ready results wait behind the items still being processed, so once depth of them
+    are waiting, FLUSH is sent through process; it has to yield (FLUSH, None) as soon
+    as it has yielded the results of every item before it, and carry on with the rest.
+    A FLUSH among the items themselves is passed on in order the same way.
+    """
+    # Entries not yet yielded, in input order, as they will be yielded; items still
+    # being processed have _PENDING as their result
+    waiting = deque()
+    ready = 0
+    
+    def misses():
+        nonlocal ready
+        for item in items:
+            if item is FLUSH:
+                waiting.append((FLUSH, None, True))
+                yield FLUSH
+                continue
+            
+            result = lookup(item)
+            if result is None:
+                waiting.append((item, _PENDING, False))
+                yield item
+                continue
+            
+            waiting.append((item, result, True))
+            ready += 1
+            if ready >= depth:
+                yield FLUSH
+    
+    def release():
+        # Yield the entries at the front whose results are ready
+        nonlocal ready
+        while waiting and waiting[0][1] is not _PENDING:
+            entry = waiting.popleft()
+            if entry[0] is not FLUSH:
+                ready -= 1
+            yield entry
+    
+    for item, result in process(misses()):
+        if item is FLUSH:
+            yield from release()
+            continue
+        
+        # Ready items listed before this one go first
+        yield from release()
+        waiting.popleft()
+        yield item, result, False
+    
+    yield from release()
+
+class DetailSpool:
+    """Temporary file holding per-file details until a report needs them, so they aren't kept in memory."""
+    def __init__(self):
+        import tempfile
+        self.file = tempfile.TemporaryFile()
+    
+    def add(self, details):
+        """Store JSON-serializable details and return the position to read them back from."""
+        position = self.file.seek(0, 2)
+        self.file.write(json.dumps(details).encode('utf-8') + b"\n")
+        return position
+    
+    def read(self, position):
+        """Return the details stored at a position."""
+        self.file.seek(position)
+        return json.loads(self.file.readline())
+    
+    def close(self):
+        """Delete the temporary file."""
+        self.file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
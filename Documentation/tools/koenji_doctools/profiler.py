@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+import sys
+import json
+import time
+import heapq
+from contextlib import contextmanager, nullcontext
+
+# Number of slowest files kept by default
+SLOWEST_FILES = 10
+
+class Profiler:
+    """Per-phase wall and CPU time plus the slowest files of a run."""
+    enabled = True
+    
+    def __init__(self, slowest=SLOWEST_FILES):
+        self.slowest = slowest
+        self.phases = {}
+        self.files = []
+        self.stack = []
+        self.started = time.perf_counter()
+        self.cpu_started = time.process_time()
+    
+    @contextmanager
+    def phase(self, name):
+        """Time a block of work; time spent in nested phases is only counted once."""
+        # Each frame collects the wall and CPU time of the phases nested inside it
+        frame = [0.0, 0.0]
+        self.stack.append(frame)
+        wall_started = time.perf_counter()
+        cpu_started = time.process_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall_started
+            cpu = time.process_time() - cpu_started
+            self.stack.pop()
+            if self.stack:
+                self.stack[-1][0] += wall
+                self.stack[-1][1] += cpu
+            
+            entry = self.phases.setdefault(name, [0, 0.0, 0.0])
+            entry[0] += 1
+            entry[1] += wall - frame[0]
+            entry[2] += cpu - frame[1]
+    
+    def iterate(self, name, iterable):
+        """Yield from an iterable, timing each step as a phase."""
+        iterator = iter(iterable)
+        while True:
+            with self.phase(name):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+    
+    @contextmanager
+    def track_file(self, file_path):
+        """Time the processing of a file for the slowest files list."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_file(str(file_path), time.perf_counter() - started)
+    
+    def record_file(self, file_path, seconds):
+        """Remember a file's processing time if it is among the slowest."""
+        if len(self.files) < self.slowest:
+            heapq.heappush(self.files, (seconds, file_path))
+        elif self.files and seconds > self.files[0][0]:
+            heapq.heapreplace(self.files, (seconds, file_path))
+    
+    def drain(self):
+        """Return the timings collected so far and start over, for sending to another process."""
+        snapshot = {'phases': self.phases, 'files': self.files}
+        self.phases = {}
+        self.files = []
+        return snapshot
+    
+    def merge(self, snapshot):
+        """Add timings collected in a worker process."""
+        if not snapshot:
+            return
+        
+        for name, (calls, wall, cpu) in snapshot['phases'].items():
+            entry = self.phases.setdefault(name, [0, 0.0, 0.0])
+            entry[0] += calls
+            entry[1] += wall
+            entry[2] += cpu
+        
+        for seconds, file_path in snapshot['files']:
+            self.record_file(file_path, seconds)
+    
+    def summary(self):
+        """Return the collected timings as a dictionary, slowest phases first."""
+        phases = sorted(self.phases.items(), key=lambda item: item[1][1], reverse=True)
+        return {
+            'wall_seconds': time.perf_counter() - self.started,
+            'cpu_seconds': time.process_time() - self.cpu_started,
+            'phases': [
+                {'name': name, 'calls': calls, 'wall_seconds': wall, 'cpu_seconds': cpu}
+                for name, (calls, wall, cpu) in phases
+            ],
+            'slowest_files': [
+                {'path': file_path, 'seconds': seconds}
+                for seconds, file_path in sorted(self.files, reverse=True)
+            ]
+        }
+    
+    def write_summary(self, stream=None, output_format='table'):
+        """Write the timings as a table or as JSON."""
+        stream = stream or sys.stderr
+        summary = self.summary()
+        
+        if output_format == 'json':
+            stream.write(json.dumps(summary, indent=2) + "\n")
+            return
+        
+        stream.write(f"\nProfile: {summary['wall_seconds']:.3f}s wall, {summary['cpu_seconds']:.3f}s CPU in the main process\n")
+        stream.write("Phase times exclude nested phases; times from worker processes are added up.\n\n")
+        stream.write(f"{'Phase':<28} {'Calls':>8} {'Wall (s)':>10} {'CPU (s)':>10}\n")
+        for phase in summary['phases']:
+            stream.write(f"{phase['name']:<28} {phase['calls']:>8} {phase['wall_seconds']:>10.3f} {phase['cpu_seconds']:>10.3f}\n")
+        
+        if summary['slowest_files']:
+            stream.write("\nSlowest files:\n")
+            for entry in summary['slowest_files']:
+                stream.write(f"{entry['seconds'] * 1000:10.1f} ms  {entry['path']}\n")
+
+class NullProfiler:
+    """Profiler used when profiling is off; every hook does as little as possible."""
+    enabled = False
+    slowest = 0
+    
+    def __init__(self):
+        self.context = nullcontext()
+    
+    def phase(self, name):
+        return self.context
+    
+    def iterate(self, name, iterable):
+        return iterable
+    
+    def track_file(self, file_path):
+        return self.context
+    
+    def drain(self):
+        return None
+    
+    def merge(self, snapshot):
+        pass
+
+# Profiler shared by everything running in this process
+_profiler = NullProfiler()
+
+def get_profiler():
+    """Return this process's profiler, a no-op one unless profiling was enabled."""
+    return _profiler
+
+def enable_profiling(slowest=SLOWEST_FILES):
+    """Start profiling this process and return the profiler."""
+    global _profiler
+    if not _profiler.enabled:
+        _profiler = Profiler(slowest)
+    return _profiler
+
+def add_profile_arguments(parser):
+    """Add the --profile options to an argument parser."""
+    parser.add_argument("--profile", nargs="?", const="table", choices=["table", "json"], help="Print per-phase timings and the slowest files to stderr when done (default format: table)")
+    parser.add_argument("--profile-top", type=int, default=SLOWEST_FILES, metavar="N", help=f"Number of slowest files to list when profiling (default: {SLOWEST_FILES})")
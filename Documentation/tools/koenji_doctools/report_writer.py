@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+import os
+
+# Reports, caches and indexes live in Documentation/reports, next to the tools folder
+REPORTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "..", "reports")
+
+# Existing reports are read in chunks of this size when comparing them with a new one
+COMPARE_CHUNK_SIZE = 1024 * 1024
+
+class ReportWriter:
+    """Stream report lines to one or more outputs as they are produced."""
+    def __init__(self, *streams):
+        self.streams = streams
+        self.started = False
+    
+    def write_line(self, text=""):
+        """Write a line, separating it from the previous one like "\\n".join would."""
+        if self.started:
+            text = "\n" + text
+        self.started = True
+        
+        for stream in self.streams:
+            stream.write(text)
+
+class ReportFile:
+    """Stream a report to a temporary file, then save it only if it differs from the file on disk.
+    
+    The report is hashed as it is written, so it is compared with the existing file
+    without being kept in memory.
+    """
+    def __init__(self, path):
+        self.path = path
+        # Written next to the target and renamed, so readers never see a half-written report
+        self.temp_path = f"{path}.{os.getpid()}.tmp"
+        self.file = None
+        self.digest = None
+        self.size = 0
+        self.changed = False
+    
+    def __enter__(self):
+        import hashlib
+        self.file = open(self.temp_path, 'wb')
+        self.digest = hashlib.sha256()
+        self.size = 0
+        return self
+    
+    def write(self, text):
+        """Write text to the temporary file and add it to the hash."""
+        data = text.encode('utf-8')
+        self.file.write(data)
+        self.digest.update(data)
+        self.size += len(data)
+        return len(text)
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.file.close()
+        try:
+            # Leave the existing file alone if the report failed part way through
+            if exc_type is None and not self._matches_existing():
+                os.replace(self.temp_path, self.path)
+                self.changed = True
+        finally:
+            if os.path.exists(self.temp_path):
+                os.remove(self.temp_path)
+        return False
+    
+    def _matches_existing(self):
+        """Check whether the file on disk already holds the report, comparing sizes before hashing."""
+        import hashlib
+        try:
+            if os.path.getsize(self.path) != self.size:
+                return False
+            
+            digest = hashlib.sha256()
+            with open(self.path, 'rb') as f:
+                for chunk in iter(lambda: f.read(COMPARE_CHUNK_SIZE), b''):
+                    digest.update(chunk)
+        except OSError:
+            return False
+        return digest.digest() == self.digest.digest()
+
+def write_if_changed(path, text):
+    """Atomically replace a file with new text unless it already holds it; return whether it was written."""
+    report_file = ReportFile(path)
+    with report_file as f:
+        f.write(text)
+    return report_file.changed
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+import os
+
+from .analysis_cache import DEFAULT_CACHE_DIR
+from .json_store import JsonStore
+
+TIMINGS_FILE_NAME = "timings.json"
+MAX_TIMINGS = 20000
+
+# Analysis speed assumed for files without a recorded time before any file has one
+DEFAULT_SECONDS_PER_BYTE = 1e-6
+
+# Seconds a single file may take before it is flagged and skipped; 0 turns the budget off
+DEFAULT_TIME_BUDGET = 60.0
+
+def file_size(file_path):
+    """Return a file's size in bytes, or 0 if it can't be read."""
+    try:
+        return os.path.getsize(file_path)
+    except OSError:
+        return 0
+
+class TimingHistory(JsonStore):
+    """Analysis time of each file in earlier runs, for starting the slowest files first.
+    
+    Entries are {absolute path: [seconds, size in bytes]}, oldest first. A file without
+    a recorded time is estimated from its size at the average speed of the recorded files.
+    """
+    description = "analysis timings"
+    
+    def __init__(self, cache_dir=None, max_entries=MAX_TIMINGS):
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        self.timings_file = os.path.join(self.cache_dir, TIMINGS_FILE_NAME)
+        super().__init__(self.timings_file, max_entries)
+        self.load()
+        
+        # Speed of the recorded files, as of loading, for estimating new ones
+        total_seconds = sum(seconds for seconds, _ in self.entries.values())
+        total_bytes = sum(size for _, size in self.entries.values())
+        self.seconds_per_byte = total_seconds / total_bytes if total_seconds and total_bytes else DEFAULT_SECONDS_PER_BYTE
+    
+    def load(self):
+        """Load the recorded times, starting empty if there are none or they can't be read."""
+        entries = (self.read() or {}).get('files')
+        if not isinstance(entries, dict):
+            return
+        
+        self.entries = {
+            path: entry for path, entry in entries.items()
+            if isinstance(entry, list) and len(entry) == 2
+        }
+    
+    def estimate(self, file_path):
+        """Return the expected analysis time of a file in seconds."""
+        size = file_size(file_path)
+        entry = self.entries.get(os.path.abspath(file_path))
+        if entry is None:
+            return size * self.seconds_per_byte
+        
+        # Scale the last time by how much the file grew or shrank since
+        seconds, recorded_size = entry
+        return seconds * size / recorded_size if recorded_size else seconds
+    
+    def record(self, file_path, seconds):
+        """Remember how long a file took this run."""
+        path = os.path.abspath(file_path)
+        self.put(path, [seconds, file_size(path)])
+    
+    def to_json(self):
+        return {'files': self.entries}
+
+def longest_first(items, cost):
+    """Return items ordered by descending cost, keeping input order between equal costs."""
+    # Sorting in reverse keeps equal items in their original order
+    return sorted(items, key=cost, reverse=True)
+
+def add_time_budget_argument(parser):
+    """Add the --time-budget option to an argument parser."""
+    parser.add_argument("--time-budget", type=float, default=DEFAULT_TIME_BUDGET, metavar="SECONDS", help=f"Flag and skip files whose analysis takes longer than this (default: {DEFAULT_TIME_BUDGET:g}, 0 for no limit)")
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+import os
+import re
+import json
+import heapq
+import hashlib
+import argparse
+
+from .analysis_results import FileStats
+
+# Version of the partial results layout written by sharded audits
+PARTIAL_SCHEMA_VERSION = "1.0"
+
+SHARD_PATTERN = re.compile(r'(\d+)/(\d+)')
+
+def parse_shard(text):
+    """Parse a --shard value such as "2/4" into (index, count), with index counted from 1."""
+    match = SHARD_PATTERN.fullmatch(text.strip())
+    if not match:
+        raise argparse.ArgumentTypeError(f"expected K/N, such as 1/4, not {text!r}")
+    
+    index, count = int(match.group(1)), int(match.group(2))
+    if count < 1 or not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"shard {index} is not between 1 and {count}")
+    return index, count
+
+def shard_name(shard):
+    """Return a file name part for a shard, such as "shard_2_of_4"."""
+    return f"shard_{shard[0]}_of_{shard[1]}"
+
+def home_shard(rel_path, count):
+    """Return the zero-based shard a relative path hashes to, the same on every machine."""
+    digest = hashlib.sha256(rel_path.replace(os.sep, "/").encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big') % count
+
+def assign_shards(file_paths, root, count):
+    """Return the zero-based shard of every file, keeping files on the shard their path hashes to while it has room.
+    
+    Files are placed largest first; a file that would take its shard past an even share of
+    the bytes goes to the shard with the fewest bytes instead. Every node sees the same files
+    and sizes, so they all compute the same assignment without talking to each other.
+    """
+    files = []
+    for position, file_path in enumerate(file_paths):
+        try:
+            size = os.path.getsize(file_path)
+        except OSError:
+            size = 0
+        rel_path = os.path.relpath(file_path, root)
+        files.append((-size, rel_path.replace(os.sep, "/"), position))
+    files.sort()
+    
+    share = -sum(size for size, _, _ in files) / count
+    loads = [0] * count
+    shards = [0] * len(files)
+    for negative_size, rel_path, position in files:
+        size = -negative_size
+        shard = home_shard(rel_path, count)
+        if loads[shard] + size > share:
+            shard = min(range(count), key=loads.__getitem__)
+        loads[shard] += size
+        shards[position] = shard
+    return shards
+
+def select_shard(file_paths, root, shard):
+    """Return (position, path) for the files of a shard, in listing order."""
+    index, count = shard
+    file_paths = list(file_paths)
+    shards = assign_shards(file_paths, root, count)
+    return [(position, file_path) for position, file_path in enumerate(file_paths) if shards[position] == index - 1]
+
+def write_partial_results(stream, shard, version, file_count, entries):
+    """Stream a shard's results as JSON Lines: a header, then (position, path, statistics) entries in listing order."""
+    stream.write(json.dumps({
+        'type': 'header',
+        'schema_version': PARTIAL_SCHEMA_VERSION,
+        'version': version,
+        'shard': shard[0],
+        'shards': shard[1],
+        'file_count': file_count
+    }) + "\n")
+    
+    written = 0
+    for position, rel_path, stats in entries:
+        stream.write(json.dumps({'type': 'file', 'position': position, 'path': rel_path, 'stats': stats.to_dict()}) + "\n")
+        written += 1
+    return written
+
+class PartialResults:
+    """A shard's results file, read back one entry at a time when merging."""
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'r') as f:
+            try:
+                header = json.loads(f.readline())
+            except ValueError:
+                header = None
+        
+        if not isinstance(header, dict) or header.get('type') != 'header':
+            raise ValueError(f"{path} is not a partial audit result file")
+        if str(header.get('schema_version', '')).split('.')[0] != PARTIAL_SCHEMA_VERSION.split('.')[0]:
+            raise ValueError(f"{path} has partial result schema {header.get('schema_version')}, expected {PARTIAL_SCHEMA_VERSION}")
+        
+        self.version = header.get('version')
+        self.shard = (header.get('shard'), header.get('shards'))
+        self.file_count = header.get('file_count')
+    
+    def __iter__(self):
+        """Yield (position, path, FileStats) in listing order."""
+        with open(self.path, 'r') as f:
+            next(f)
+            for line in f:
+                record = json.loads(line)
+                yield record['position'], record['path'], FileStats.from_dict(record['stats'])
+
+def load_partial_results(paths, version):
+    """Open the partial results of every shard of one audit, raising ValueError if they don't fit together."""
+    partials = [PartialResults(path) for path in paths]
+    if not partials:
+        raise ValueError("No partial results given")
+    
+    count = partials[0].shard[1]
+    found = {}
+    for partial in partials:
+        if partial.shard[1] != count:
+            raise ValueError(f"{partial.path} is shard {partial.shard[0]}/{partial.shard[1]}, but {partials[0].path} is one of {count}")
+        if partial.shard[0] in found:
+            raise ValueError(f"{partial.path} and {found[partial.shard[0]]} are both shard {partial.shard[0]}/{count}")
+        if partial.version != version:
+            raise ValueError(f"{partial.path} comes from analyzer version {partial.version}, not {version}")
+        if partial.file_count != partials[0].file_count:
+            raise ValueError(f"{partial.path} was split from {partial.file_count} files, but {partials[0].path} from {partials[0].file_count}")
+        found[partial.shard[0]] = partial.path
+    
+    missing = [str(index) for index in range(1, count + 1) if index not in found]
+    if missing:
+        raise ValueError(f"Missing the results of shard {', '.join(missing)} of {count}")
+    return partials
+
+def merge_partial_results(partials):
+    """Yield (path, FileStats) from every shard in the order a single run would have analyzed them."""
+    for _, rel_path, stats in heapq.merge(*partials, key=lambda entry: entry[0]):
+        yield rel_path, stats
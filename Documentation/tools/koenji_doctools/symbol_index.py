@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+import os
+
+from .analysis_cache import DEFAULT_CACHE_DIR, hash_file
+
+# Default index location, next to the analysis cache
+DEFAULT_INDEX_PATH = os.path.join(DEFAULT_CACHE_DIR, "symbols.db")
+
+# Symbol kinds stored in the index, keyed by the Swift keyword that declares them
+SYMBOL_KINDS = {
+    'class': 'class',
+    'struct': 'struct',
+    'enum': 'enum',
+    'protocol': 'protocol',
+    'extension': 'extension',
+    'func': 'method',
+    'let': 'property',
+    'var': 'property'
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    hash TEXT NOT NULL,
+    version TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS symbols (
+    file TEXT NOT NULL REFERENCES files(path) ON DELETE CASCADE,
+    line INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    documented INTEGER NOT NULL,
+    counted INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS symbols_file ON symbols(file);
+CREATE INDEX IF NOT EXISTS symbols_kind ON symbols(kind, documented);
+"""
+
+class SymbolIndex:
+    """SQLite index of every Swift declaration and whether it is documented."""
+    def __init__(self, db_path=None):
+        self.db_path = db_path or DEFAULT_INDEX_PATH
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        
+        # SQLite is only loaded by the commands that open the index
+        import sqlite3
+        self.connection = sqlite3.connect(self.db_path)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.executescript(SCHEMA)
+    
+    def close(self):
+        """Close the database connection."""
+        self.connection.close()
+    
+    def update(self, generator, file_paths, project_root, scope=None):
+        """Re-index files whose content changed and drop files that no longer exist."""
+        # Paths are stored relative to the project root; only files under the
+        # scope being indexed are candidates for removal
+        version = generator.cache_version()
+        known = self._known_files(scope)
+        updated = 0
+        
+        with self.connection:
+            for file_path in file_paths:
+                rel_path = os.path.relpath(file_path, project_root)
+                try:
+                    file_hash = hash_file(file_path)
+                    if known.get(rel_path) == (file_hash, version):
+                        del known[rel_path]
+                        continue
+                    
+                    # Large files are scanned memory-mapped, so only their symbols are held in memory
+                    with generator.open_source(file_path) as content:
+                        rows = list(self._symbol_rows(generator, rel_path, content))
+                except (OSError, UnicodeDecodeError) as e:
+                    print(f"Error indexing {file_path}: {e}")
+                    continue
+                
+                known.pop(rel_path, None)
+                self.connection.execute("DELETE FROM files WHERE path = ?", (rel_path,))
+                self.connection.execute(
+                    "INSERT INTO files (path, hash, version) VALUES (?, ?, ?)",
+                    (rel_path, file_hash, version)
+                )
+                self.connection.executemany(
+                    "INSERT INTO symbols (file, line, kind, name, documented, counted) VALUES (?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+                updated += 1
+            
+            # Anything left over was deleted or renamed since the last run
+            self.connection.executemany("DELETE FROM files WHERE path = ?", [(path,) for path in known])
+        
+        return updated, len(known)
+    
+    def _known_files(self, scope):
+        """Return {path: (hash, version)} for indexed files under a scope."""
+        clause, params = self._scope_clause('path', scope)
+        rows = self.connection.execute(f"SELECT path, hash, version FROM files WHERE {clause}", params)
+        return {path: (file_hash, version) for path, file_hash, version in rows}
+    
+    def _symbol_rows(self, generator, rel_path, content):
+        """Yield index rows for a file, flagging the items that count toward coverage."""
+        seen_classes = set()
+        
+        for declaration in generator.scan_declarations(content):
+            # Mirror analyze_file: extensions and repeated type names don't count
+            counted = declaration.kind != 'extension'
+            if declaration.kind == 'class':
+                counted = declaration.name not in seen_classes
+                seen_classes.add(declaration.name)
+            
+            yield (
+                rel_path,
+                declaration.line,
+                SYMBOL_KINDS[declaration.keyword],
+                declaration.name,
+                int(declaration.documented),
+                int(counted)
+            )
+    
+    def undocumented(self, kind=None, scope=None):
+        """Return (file, line, kind, name) for undocumented symbols, in file order.
+        
+        Only symbols that count toward coverage are listed, so extensions and repeated
+        declarations of a type are left out unless extensions are asked for by kind.
+        """
+        clause, params = self._scope_clause('file', scope)
+        if kind:
+            clause += " AND kind = ?"
+            params.append(kind)
+        if kind != 'extension':
+            clause += " AND counted = 1"
+        
+        return self.connection.execute(
+            f"SELECT file, line, kind, name FROM symbols WHERE documented = 0 AND {clause} ORDER BY file, line",
+            params
+        ).fetchall()
+    
+    def coverage_by_folder(self, scope=None, depth=1):
+        """Return (folder, documented, total) for counted symbols, grouped by folder."""
+        clause, params = self._scope_clause('file', scope)
+        rows = self.connection.execute(
+            f"SELECT file, SUM(documented), COUNT(*) FROM symbols WHERE counted = 1 AND {clause} GROUP BY file",
+            params
+        )
+        
+        folders = {}
+        for file_path, documented, total in rows:
+            parts = os.path.dirname(file_path).split(os.sep)
+            folder = os.sep.join(parts[:depth]) or "."
+            folder_documented, folder_total = folders.get(folder, (0, 0))
+            folders[folder] = (folder_documented + documented, folder_total + total)
+        
+        return [(folder, documented, total) for folder, (documented, total) in sorted(folders.items())]
+    
+    def _scope_clause(self, column, scope):
+        """Return a SQL condition limiting a path column to a folder or file."""
+        scope = os.path.normpath(scope) if scope else "."
+        if scope == ".":
+            return "1 = 1", []
+        
+        # Match the path itself or anything below it; escape LIKE wildcards in folder names
+        escaped = scope.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        return f"({column} = ? OR {column} LIKE ? ESCAPE '\\')", [scope, escaped + os.sep + "%"]
@@ -0,0 +1,1060 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import heapq
+import argparse
+import json
+import time
+
+from .analysis_cache import AnalysisCache
+from .report_writer import REPORTS_DIR, ReportWriter, ReportFile, write_if_changed
+from .symbol_index import SymbolIndex, DEFAULT_INDEX_PATH, SYMBOL_KINDS
+from .file_discovery import find_swift_files, stream_swift_files
+from .pipeline import ordered_merge, DetailSpool
+from .analysis_results import Coverage, FileStats
+from .audit_formats import REPORT_FORMATS, FORMAT_EXTENSIONS, write_audit_report
+from .sharding import parse_shard, shard_name, select_shard, write_partial_results, load_partial_results, merge_partial_results
+from .scheduling import TimingHistory, DEFAULT_TIME_BUDGET, add_time_budget_argument
+from .profiler import get_profiler, enable_profiling, add_profile_arguments
+from .audit import DocumentationAudit
+from .generator import DocumentationGenerator, default_jobs
+
+# Default number of files listed per priority group, and the coverage below which a file counts as low
+PRIORITY_TOP = 10
+LOW_COVERAGE_THRESHOLD = 20.0
+
+# File name endings of the reports written for each Swift file
+REPORT_SUFFIXES = {
+    "audits": "_audit",
+    "suggestions": "_suggestions"
+}
+
+# Markers that identify the project root, checked from the innermost folder up
+PROJECT_ROOT_MARKERS = [
+    "KoenjiApp",  # Your project name
+    ".git",       # Git repository
+    "Package.swift", # Swift package
+    "project.pbxproj" # Xcode project
+]
+
+# Project root given with --project-root, and the roots already found for each folder
+_project_root_override = None
+_project_roots = {}
+
+# Seconds a file's analysis may take, from --time-budget
+_time_budget = DEFAULT_TIME_BUDGET
+
+def print_header(text):
+    """Print a formatted header."""
+    print("\n" + "=" * 80)
+    print(f" {text} ".center(80, "="))
+    print("=" * 80 + "\n")
+
+def print_saved(description, output_file, changed):
+    """Report where an output file is, and whether this run had to rewrite it."""
+    if changed:
+        print(f"{description} saved to {os.path.abspath(output_file)}")
+    else:
+        print(f"{description} unchanged at {os.path.abspath(output_file)}")
+
+def run_command(command):
+    """Run a command and return its output."""
+    # Only --since runs commands, so the other commands don't pay for importing subprocess
+    import subprocess
+    
+    try:
+        with get_profiler().phase('subprocess'):
+            result = subprocess.run(
+                command,
+                capture_output=True,
+                text=True,
+                check=True
+            )
+        return result.stdout
+    except subprocess.CalledProcessError as e:
+        print(f"Error running command: {e}")
+        print(f"stderr: {e.stderr}")
+        return None
+
+def set_time_budget(seconds):
+    """Set how long a single file's analysis may take before it is skipped, or 0 for no limit."""
+    global _time_budget
+    _time_budget = seconds
+
+def scheduled_generator():
+    """Return a generator that runs the slowest files first and skips files that exceed the time budget."""
+    return DocumentationGenerator(time_budget=_time_budget, timings=TimingHistory())
+
+def analyze_stats(file_paths, jobs=1, use_cache=True):
+    """Analyze several Swift files and return their statistics keyed by path."""
+    file_paths = list(file_paths)
+    return dict(iter_analyze_stats(file_paths, jobs=min(jobs, len(file_paths)), use_cache=use_cache))
+
+def iter_analyze_stats(file_paths, jobs=1, use_cache=True):
+    """Yield (path, statistics) pairs in input order as each file finishes."""
+    generator = scheduled_generator()
+    cache = AnalysisCache(generator.cache_version()) if use_cache else None
+    for file_path, result in generator.iter_analyze_files(file_paths, analyze_only=True, jobs=jobs, cache=cache):
+        yield file_path, result['stats'] if result else None
+
+def iter_analyze_with_suggestions(file_paths, jobs=1):
+    """Analyze files once, saving each file's suggestions as it finishes, and yield (path, statistics) pairs in input order."""
+    generator = scheduled_generator()
+    for file_path, result in generator.iter_analysis_reports(file_paths, jobs=jobs):
+        if result is None:
+            yield file_path, None
+            continue
+        
+        # Match the output of running the generator script directly
+        stats, report = result
+        analyze_file(file_path, f"Analyzing {file_path}...\n{report}\n")
+        yield file_path, stats
+
+def iter_suggestions(file_paths, jobs=1):
+    """Yield (path, suggestions output) pairs in input order as each file finishes."""
+    reports = scheduled_generator().iter_documentation_reports(file_paths, jobs=jobs)
+    # Match the output of running the generator script directly
+    for file_path, report in reports:
+        yield file_path, f"Analyzing {file_path}...\n{report}\n" if report is not None else None
+
+def stream_suggestions(file_path, output_file):
+    """Stream a file's suggestions to the console as they are generated, then save them if they changed.
+    
+    Returns whether the report file was written, or None if the file couldn't be analyzed.
+    """
+    def write(file_path):
+        report_file = ReportFile(output_file)
+        # A failed report leaves the previous one in place
+        with report_file as f:
+            for stream in (sys.stdout, f):
+                stream.write(f"Analyzing {file_path}...\n")
+            generator.write_documentation_report(file_path, sys.stdout, f)
+            for stream in (sys.stdout, f):
+                stream.write("\n")
+        return report_file.changed
+    
+    generator = DocumentationGenerator(time_budget=_time_budget)
+    changed = generator.run_budgeted(file_path, write)
+    if changed is not None:
+        print()
+    return changed
+
+def analyze_file(file_path, output=None):
+    """Analyze a single file and generate documentation suggestions."""
+    print_header(f"Analyzing {file_path}")
+    
+    # Get absolute path to the file
+    abs_file_path = os.path.abspath(file_path)
+    
+    # Get the project root directory from the file's folder, which is usually resolved already
+    project_root = find_project_root(os.path.dirname(abs_file_path))
+    if not project_root:
+        print(f"Error: Could not determine project root for {abs_file_path}")
+        return None
+    
+    # Get the relative path from the project root
+    rel_path = os.path.relpath(abs_file_path, project_root)
+    
+    # Get file name without extension
+    file_name = os.path.basename(file_path)
+    base_name = os.path.splitext(file_name)[0]
+    
+    # Create the output directory structure that mirrors the codebase
+    rel_dir = os.path.dirname(rel_path)
+    output_dir = os.path.join(REPORTS_DIR, "suggestions", rel_dir)
+    os.makedirs(output_dir, exist_ok=True)
+    
+    # Set the output file path
+    output_file = os.path.join(output_dir, f"{base_name}_suggestions.md")
+    
+    # Stream the suggestions straight to the report file unless the caller already generated them
+    if output is None:
+        changed = stream_suggestions(abs_file_path, output_file)
+        if changed is None:
+            return None
+        
+        print_saved("Documentation suggestions", output_file, changed)
+        return output_file
+    
+    if output:
+        print(output)
+    
+    # Save the output to a file
+    if output:
+        with get_profiler().phase('write report'):
+            changed = write_if_changed(output_file, output)
+        
+        print_saved("Documentation suggestions", output_file, changed)
+        return output_file
+    
+    return None
+
+def audit_output_path(file_path):
+    """Return the path of a file's audit report, mirroring the codebase layout."""
+    # Get absolute path to the file
+    abs_file_path = os.path.abspath(file_path)
+    
+    # Get the project root directory from the file's folder, which is usually resolved already
+    project_root = find_project_root(os.path.dirname(abs_file_path))
+    if not project_root:
+        print(f"Error: Could not determine project root for {abs_file_path}")
+        return None
+    
+    # Get the relative path from the project root
+    rel_path = os.path.relpath(abs_file_path, project_root)
+    
+    # Get file name without extension
+    file_name = os.path.basename(file_path)
+    base_name = os.path.splitext(file_name)[0]
+    
+    # Mirror the file's directory under reports/audits
+    rel_dir = os.path.dirname(rel_path)
+    output_dir = os.path.join(REPORTS_DIR, "audits", rel_dir)
+    return os.path.join(output_dir, f"{base_name}_audit.md")
+
+def audit_single_file(file_path, analysis=None, use_cache=True):
+    """Audit a single file and generate an audit report."""
+    print_header(f"Auditing {file_path}")
+    
+    # Get absolute path to the file
+    abs_file_path = os.path.abspath(file_path)
+    file_name = os.path.basename(file_path)
+    
+    # Set the output file path
+    output_file = audit_output_path(abs_file_path)
+    if not output_file:
+        return None, None
+    
+    # Create the output directory structure that mirrors the codebase
+    os.makedirs(os.path.dirname(output_file), exist_ok=True)
+    
+    # Run the documentation generator in analysis mode unless the caller already did
+    if analysis is None:
+        analysis = analyze_stats([abs_file_path], use_cache=use_cache)[abs_file_path]
+        if analysis is None:
+            return None, None
+    
+    # Generate a simple audit report for this file
+    report_file = ReportFile(output_file)
+    with get_profiler().phase('write report'), report_file as f:
+        write_file_audit(f, file_name, analysis)
+    
+    print_saved(f"Audit report for {file_name}", output_file, report_file.changed)
+    return output_file, analysis
+
+def write_file_audit(stream, file_name, analysis):
+    """Stream the audit report for a single file."""
+    coverage = analysis.coverage_percentage
+    total = analysis.total_items
+    documented = analysis.documented_items
+    
+    report = ReportWriter(stream)
+    report.write_line(f"# Documentation Audit for {file_name}")
+    report.write_line("")
+    report.write_line(f"## Summary")
+    report.write_line("")
+    report.write_line(f"- **Coverage:** {coverage:.2f}%")
+    report.write_line(f"- **Items:** {documented}/{total}")
+    report.write_line("")
+    
+    # Add details about missing documentation
+    report.write_line("## Missing Documentation")
+    report.write_line("")
+    
+    for item_type, items in analysis.missing_documentation.items():
+        if items:
+            report.write_line(f"### {item_type.title()}")
+            for item in items:
+                report.write_line(f"- `{item}`")
+            report.write_line("")
+
+def write_audit_summary(stream, file_stats, total_items, documented_items, summary_file):
+    """Stream the summary audit report for a directory."""
+    # Calculate overall statistics
+    coverage_percentage = (documented_items / total_items * 100) if total_items > 0 else 0
+    
+    # Sort files by documentation coverage (ascending)
+    sorted_files = sorted(
+        file_stats.items(),
+        key=lambda x: x[1]['stats'].coverage_percentage
+    )
+    
+    report = ReportWriter(stream)
+    report.write_line("# Documentation Audit Report")
+    report.write_line("")
+    report.write_line(f"## Summary")
+    report.write_line("")
+    report.write_line(f"- **Files analyzed:** {len(file_stats)}")
+    report.write_line(f"- **Total items:** {total_items}")
+    report.write_line(f"- **Documented items:** {documented_items}")
+    report.write_line(f"- **Overall coverage:** {coverage_percentage:.2f}%")
+    report.write_line("")
+    report.write_line("## Files by Coverage (Lowest to Highest)")
+    report.write_line("")
+    
+    for file_path, file_data in sorted_files:
+        stats = file_data['stats']
+        audit_file = file_data['audit_file']
+        coverage = stats.coverage_percentage
+        total = stats.total_items
+        documented = stats.documented_items
+        
+        # Create a relative path from the summary file to the audit file
+        if audit_file:
+            # Get the relative path from the summary file directory to the audit file
+            audit_file_rel_path = os.path.relpath(audit_file, os.path.dirname(summary_file))
+            # Create a markdown link to the audit file
+            file_link = f"[{file_path}]({audit_file_rel_path})"
+        else:
+            file_link = file_path
+        
+        report.write_line(f"### {file_link}")
+        report.write_line(f"- Coverage: {coverage:.2f}%")
+        report.write_line(f"- Items: {documented}/{total}")
+        report.write_line("")
+
+def changed_files_since(ref, directory):
+    """Return the paths under a directory that changed since a git ref, relative to it."""
+    output = run_command(["git", "-C", directory, "diff", "--name-only", "--relative", "-z", ref, "--", "."])
+    if output is None:
+        return None
+    
+    return {os.path.normpath(path) for path in output.split("\0") if path}
+
+def load_audit_results(results_file):
+    """Load the per-file results saved by a previous audit, or None if unavailable."""
+    try:
+        with open(results_file, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def analyzer_version():
+    """Return the version of the analysis that produced the current results."""
+    return DocumentationGenerator().cache_version()
+
+def run_audit(directory, jobs=1, use_cache=True, since=None, suggestions=False, report_format="markdown", shard=None):
+    """Run a documentation audit on a directory, optionally saving every file's suggestions from the same analysis.
+    
+    Any report_format other than markdown also saves a JSON, JSON Lines or SARIF report next to the summary.
+    With an (index, count) shard, only that shard's files are audited and their partial results are
+    saved for merge_audits instead of the summary.
+    """
+    print_header(f"Running Documentation Audit on {directory}")
+    
+    # Get absolute path to the directory
+    abs_directory_path = os.path.abspath(directory)
+    
+    # Check if this is a file instead of a directory
+    if os.path.isfile(abs_directory_path):
+        if shard:
+            print("Error: --shard splits the files of a directory, not a single file")
+            return None
+        audit_file, analysis = audit_single_file(abs_directory_path, use_cache=use_cache)
+        if audit_file and report_format != "markdown":
+            save_machine_report(
+                machine_report_path(audit_file, report_format),
+                report_format,
+                [(os.path.basename(abs_directory_path), analysis)],
+                os.path.dirname(abs_directory_path)
+            )
+        return audit_file
+    
+    # The summary report and its per-file results live next to each other
+    summary_file, results_file = audit_summary_paths(directory)
+    if not summary_file:
+        return None
+    
+    # Files stream from discovery through analysis to their reports; only their summary statistics are kept
+    if shard:
+        # Every node lists the whole tree so they all split it the same way
+        listing = find_swift_files(abs_directory_path)
+        selected = select_shard(listing, abs_directory_path, shard)
+        listing_positions = {os.path.relpath(file_path, abs_directory_path): position for position, file_path in selected}
+        swift_files = [file_path for _, file_path in selected]
+    else:
+        swift_files = stream_swift_files(abs_directory_path)
+    file_stats = {}
+    
+    # The results file, partial results and machine-readable reports list every undocumented item,
+    # so those wait in a temporary file until they are written
+    details = DetailSpool()
+    detail_positions = {}
+    
+    def analyze(file_paths):
+        if suggestions:
+            return iter_analyze_with_suggestions(file_paths, jobs=jobs)
+        return iter_analyze_stats(file_paths, jobs=jobs, use_cache=use_cache)
+    
+    # In incremental mode, reuse the previous results for files unchanged since the ref
+    previous_files = {}
+    changed = None
+    if since and suggestions:
+        print("Generating suggestions for every file, so all files are re-audited regardless of --since")
+    elif since:
+        previous = load_audit_results(results_file)
+        changed = changed_files_since(since, abs_directory_path)
+        
+        if not previous or previous.get('version') != analyzer_version():
+            print("No compatible previous audit results found, running a full audit")
+            changed = None
+        elif changed is None:
+            print(f"Could not list files changed since {since}, running a full audit")
+        else:
+            previous_files = previous.get('files', {})
+    
+    def reuse_previous(file_path):
+        if changed is None:
+            return None
+        rel_file_path = os.path.relpath(file_path, abs_directory_path)
+        audit_file = audit_output_path(file_path)
+        
+        # New files, files whose report has gone missing and results saved without the undocumented items are analyzed as well
+        previous_stats = previous_files.get(rel_file_path)
+        if (rel_file_path in changed or not previous_stats or 'missing_lines' not in previous_stats
+                or not audit_file or not os.path.exists(audit_file)):
+            return None
+        return FileStats.from_dict(previous_stats)
+    
+    reused = 0
+    for file_path, analysis, from_previous in ordered_merge(swift_files, reuse_previous, analyze):
+        rel_file_path = os.path.relpath(file_path, abs_directory_path)
+        print(f"Auditing {rel_file_path}...")
+        
+        if from_previous:
+            # Deleted and renamed files are never discovered, so they drop out of the totals
+            audit_file = audit_output_path(file_path)
+            reused += 1
+        else:
+            if analysis is None:
+                continue
+            audit_file, analysis = audit_single_file(file_path, analysis)
+        
+        if analysis:
+            file_stats[rel_file_path] = {
+                'stats': analysis.coverage(),
+                'audit_file': audit_file
+            }
+            detail_positions[rel_file_path] = details.add(analysis.to_dict())
+    
+    if changed is not None:
+        print(f"Reused previous results for {reused} files unchanged since {since}")
+    
+    with details:
+        if shard:
+            # The summary needs every shard, so it is written by merge_audits
+            print(f"Audited {len(swift_files)} of {len(listing)} Swift files in shard {shard[0]}/{shard[1]}")
+            entries = (
+                (listing_positions[rel_file_path], rel_file_path, stats)
+                for rel_file_path, stats in spooled_file_stats(details, detail_positions)
+            )
+            summary_file = save_partial_results(partial_results_path(summary_file, shard), shard, entries, len(listing))
+        else:
+            save_audit_summary(file_stats, summary_file, results_file, spooled_file_stats(details, detail_positions))
+            
+            if report_format != "markdown":
+                files = spooled_file_stats(details, detail_positions)
+                save_machine_report(machine_report_path(summary_file, report_format), report_format, files, abs_directory_path)
+    
+    # Drop the reports of Swift files that were deleted, renamed or excluded since the last run
+    prune_reports(abs_directory_path, "audits")
+    if suggestions:
+        prune_reports(abs_directory_path, "suggestions")
+    return summary_file
+
+def audit_summary_paths(directory):
+    """Return the summary report and results file paths for a directory audit."""
+    abs_directory_path = os.path.abspath(directory)
+    
+    # Get the project root directory
+    project_root = find_project_root(abs_directory_path)
+    if not project_root:
+        print(f"Error: Could not determine project root for {abs_directory_path}")
+        return None, None
+    
+    # Get the relative path from the project root
+    rel_path = os.path.relpath(abs_directory_path, project_root)
+    
+    # Create the output directory structure that mirrors the codebase
+    output_dir = os.path.join(REPORTS_DIR, "audits", rel_path)
+    os.makedirs(output_dir, exist_ok=True)
+    
+    dir_name = os.path.basename(directory.rstrip('/'))
+    return (
+        os.path.join(output_dir, f"{dir_name}_audit.md"),
+        os.path.join(output_dir, f"{dir_name}_audit.json")
+    )
+
+def spooled_file_stats(details, detail_positions):
+    """Yield (path, statistics) for files whose statistics wait in a detail spool, in the order they were added."""
+    for rel_file_path, position in detail_positions.items():
+        yield rel_file_path, FileStats.from_dict(details.read(position))
+
+def partial_results_path(summary_file, shard):
+    """Return where a shard saves the partial results that stand in for a directory's summary."""
+    return os.path.splitext(summary_file)[0] + f"_{shard_name(shard)}.jsonl"
+
+def save_partial_results(output_file, shard, entries, file_count):
+    """Write a shard's (position, path, statistics) entries for merge_audits to combine."""
+    report_file = ReportFile(output_file)
+    with get_profiler().phase('write results'), report_file as f:
+        write_partial_results(f, shard, analyzer_version(), file_count, entries)
+    
+    print_saved(f"Partial results of shard {shard[0]}/{shard[1]}", output_file, report_file.changed)
+    return output_file
+
+def merge_audits(directory, partial_files, report_format="markdown", audit_report=None):
+    """Combine the partial results of every shard into the reports a single audit of the directory would write.
+    
+    Per-file audit reports, the summary and its results file are written as usual; audit_report
+    additionally saves documentation_audit.py's report for the directory.
+    """
+    print_header(f"Merging Documentation Audits of {directory}")
+    
+    abs_directory_path = os.path.abspath(directory)
+    
+    try:
+        partials = load_partial_results(partial_files, analyzer_version())
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        return None
+    
+    summary_file, results_file = audit_summary_paths(directory)
+    if not summary_file:
+        return None
+    
+    # Shards are read together one entry at a time, in the order a single run lists the files
+    file_stats = {}
+    details = DetailSpool()
+    detail_positions = {}
+    audit = DocumentationAudit(abs_directory_path) if audit_report else None
+    
+    for rel_file_path, analysis in merge_partial_results(partials):
+        print(f"Merging {rel_file_path}...")
+        audit_file, _ = audit_single_file(os.path.join(abs_directory_path, rel_file_path), analysis)
+        
+        file_stats[rel_file_path] = {
+            'stats': analysis.coverage(),
+            'audit_file': audit_file
+        }
+        detail_positions[rel_file_path] = details.add(analysis.to_dict())
+        if audit:
+            audit.add_result(rel_file_path, analysis)
+    
+    print(f"Merged {len(file_stats)} files from {len(partials)} shards")
+    with details:
+        save_audit_summary(file_stats, summary_file, results_file, spooled_file_stats(details, detail_positions))
+        
+        if report_format != "markdown":
+            files = spooled_file_stats(details, detail_positions)
+            save_machine_report(machine_report_path(summary_file, report_format), report_format, files, abs_directory_path)
+    
+    if audit:
+        with audit:
+            audit.generate_report(audit_report)
+    return summary_file
+
+def machine_report_path(markdown_file, report_format):
+    """Return where the JSON, JSON Lines or SARIF version of a markdown audit report is saved."""
+    return os.path.splitext(markdown_file)[0] + "_report" + FORMAT_EXTENSIONS[report_format]
+
+def save_machine_report(output_file, report_format, files, root):
+    """Write (path, statistics) pairs, with paths relative to root, as a JSON, JSON Lines or SARIF report."""
+    report_file = ReportFile(output_file)
+    with get_profiler().phase('write report'), report_file as f:
+        write_audit_report(f, report_format, files, root, analyzer_version())
+    
+    print_saved(f"{report_format.upper()} audit report", output_file, report_file.changed)
+    return output_file
+
+def write_audit_results(stream, files):
+    """Write (path, statistics) pairs one at a time as the JSON results file a later audit reads back."""
+    stream.write(f'{{\n  "version": {json.dumps(analyzer_version())},\n  "files": {{')
+    separator = "\n"
+    for rel_file_path, stats in files:
+        # Laid out as json.dumps with indent=2 lays out the whole document
+        entry = json.dumps(stats.to_dict(), indent=2).replace("\n", "\n    ")
+        stream.write(f"{separator}    {json.dumps(rel_file_path)}: {entry}")
+        separator = ",\n"
+    stream.write("\n  }\n}" if separator != "\n" else "}\n}")
+
+def save_audit_summary(file_stats, summary_file, results_file, files):
+    """Write a directory's per-file results and its summary report.
+    
+    files yields the (path, statistics) pairs of file_stats, in the same order, with their undocumented items.
+    """
+    total_items = sum(file_data['stats'].total_items for file_data in file_stats.values())
+    documented_items = sum(file_data['stats'].documented_items for file_data in file_stats.values())
+    
+    # Save the per-file results, undocumented items included, so later incremental audits can reuse them in every output format
+    with get_profiler().phase('write results'), ReportFile(results_file) as f:
+        write_audit_results(f, files)
+    
+    # Generate a summary report for the directory
+    report_file = ReportFile(summary_file)
+    with get_profiler().phase('write summary'), report_file as f:
+        write_audit_summary(f, file_stats, total_items, documented_items, summary_file)
+    
+    print_saved("Summary audit report", summary_file, report_file.changed)
+
+def watch_directory(directory, interval=0.1, jobs=1, use_cache=True):
+    """Keep a directory's audit reports up to date as its Swift files change."""
+    abs_directory_path = os.path.abspath(directory)
+    if not os.path.isdir(abs_directory_path):
+        print(f"Error: {directory} is not a directory")
+        return
+    
+    # Start from a full audit, then keep its results in memory
+    summary_file = run_audit(directory, jobs=jobs, use_cache=use_cache)
+    if not summary_file:
+        return
+    
+    # The counts are kept in memory and the undocumented items, which the results file also needs, in a spool
+    summary_file, results_file = audit_summary_paths(directory)
+    results = {}
+    details = DetailSpool()
+    detail_positions = {}
+    for file_path, stats in load_audit_results(results_file)['files'].items():
+        results[file_path] = Coverage.from_dict(stats)
+        detail_positions[file_path] = details.add(stats)
+    mtimes = swift_file_mtimes(abs_directory_path)
+    
+    # One generator and cache serve every change, so their timings and entries stay loaded
+    generator = scheduled_generator()
+    cache = AnalysisCache(generator.cache_version()) if use_cache else None
+    
+    print_header(f"Watching {directory} for changes (Ctrl+C to stop)")
+    
+    try:
+        while True:
+            time.sleep(interval)
+            
+            current_mtimes = swift_file_mtimes(abs_directory_path)
+            if current_mtimes == mtimes:
+                continue
+            
+            started = time.perf_counter()
+            changed = [path for path, mtime in current_mtimes.items() if mtimes.get(path) != mtime]
+            removed = [path for path in mtimes if path not in current_mtimes]
+            mtimes = current_mtimes
+            
+            # Re-analyze only the files that were saved since the last check
+            analyses = generator.iter_analyze_files(changed, analyze_only=True, jobs=min(jobs, len(changed)), cache=cache)
+            for file_path, result in analyses:
+                rel_file_path = os.path.relpath(file_path, abs_directory_path)
+                if result is None:
+                    # A file that can no longer be analyzed drops out of the summary, so its report goes too
+                    results.pop(rel_file_path, None)
+                    remove_audit_report(file_path)
+                    continue
+                analysis = result['stats']
+                audit_single_file(file_path, analysis)
+                results[rel_file_path] = analysis.coverage()
+                detail_positions[rel_file_path] = details.add(analysis.to_dict())
+            
+            for file_path in removed:
+                results.pop(os.path.relpath(file_path, abs_directory_path), None)
+                remove_audit_report(file_path)
+            
+            # Rebuild the summary in discovery order so it matches a full audit
+            file_stats = {}
+            for file_path in current_mtimes:
+                rel_file_path = os.path.relpath(file_path, abs_directory_path)
+                if rel_file_path in results:
+                    file_stats[rel_file_path] = {
+                        'stats': results[rel_file_path],
+                        'audit_file': audit_output_path(file_path)
+                    }
+            positions = {rel_file_path: detail_positions[rel_file_path] for rel_file_path in file_stats}
+            save_audit_summary(file_stats, summary_file, results_file, spooled_file_stats(details, positions))
+            
+            elapsed = (time.perf_counter() - started) * 1000
+            print(f"[{time.strftime('%H:%M:%S')}] Updated {len(changed)} changed and {len(removed)} removed files in {elapsed:.0f} ms")
+    except KeyboardInterrupt:
+        print("\nStopped watching")
+    finally:
+        details.close()
+
+def remove_audit_report(file_path):
+    """Delete a Swift file's audit report if there is one."""
+    audit_file = audit_output_path(file_path)
+    if audit_file and os.path.exists(audit_file):
+        os.remove(audit_file)
+
+def swift_file_mtimes(directory):
+    """Return the modification time of every Swift file in a directory, in discovery order."""
+    mtimes = {}
+    # Files come and go while watching, so list the folder again every time
+    for file_path in find_swift_files(directory, refresh=True):
+        try:
+            mtimes[file_path] = os.stat(file_path).st_mtime_ns
+        except OSError:
+            # The file disappeared between listing and stat; it'll count as removed
+            continue
+    return mtimes
+
+def set_project_root(path):
+    """Use a fixed project root instead of looking for markers, or go back to looking with None."""
+    global _project_root_override
+    _project_root_override = os.path.abspath(path) if path else None
+
+def find_project_root(path):
+    """Find the project root directory by looking for common markers."""
+    path = os.path.abspath(path)
+    
+    # An explicit root applies to everything inside it
+    if _project_root_override:
+        if os.path.commonpath([path, _project_root_override]) == _project_root_override:
+            return _project_root_override
+        return None
+    
+    if path in _project_roots:
+        return _project_roots[path]
+    
+    # If path is a file, get its directory
+    if os.path.isfile(path):
+        path = os.path.dirname(path)
+    
+    # Start from the given path and move up until we find a marker or a folder resolved earlier
+    project_root = None
+    visited = []
+    current_path = path
+    while current_path != os.path.dirname(current_path):  # Stop at filesystem root
+        if current_path in _project_roots:
+            project_root = _project_roots[current_path]
+            break
+        visited.append(current_path)
+        
+        marker = next((marker for marker in PROJECT_ROOT_MARKERS if os.path.exists(os.path.join(current_path, marker))), None)
+        if marker:
+            # If the marker is the project folder, return that folder,
+            # otherwise return the directory containing the marker
+            if marker == "KoenjiApp" and os.path.isdir(os.path.join(current_path, marker)):
+                project_root = os.path.join(current_path, marker)
+            else:
+                project_root = current_path
+            break
+        
+        # Move up one directory
+        current_path = os.path.dirname(current_path)
+    
+    # Every folder on the way up resolves to the same root, so later lookups stop there
+    for directory in visited:
+        _project_roots[directory] = project_root
+    return project_root
+
+def analyze_directory(directory, jobs=1):
+    """Analyze all Swift files in a directory recursively."""
+    print_header(f"Analyzing all files in {directory}")
+    
+    # Get absolute path to the directory
+    abs_directory_path = os.path.abspath(directory)
+    
+    # Each file's suggestions are saved as soon as they are ready, while discovery is still running
+    swift_files = stream_swift_files(abs_directory_path)
+    analyzed = 0
+    
+    if jobs <= 1:
+        # Analyze each file, streaming its suggestions as they are generated
+        for file_path in swift_files:
+            rel_path = os.path.relpath(file_path, abs_directory_path)
+            print(f"Analyzing {rel_path}...")
+            analyze_file(file_path)
+            analyzed += 1
+    else:
+        # Save each file's suggestions as soon as its worker finishes, in discovery order
+        for file_path, output in iter_suggestions(swift_files, jobs=jobs):
+            rel_path = os.path.relpath(file_path, abs_directory_path)
+            print(f"Analyzing {rel_path}...")
+            analyze_file(file_path, output)
+            analyzed += 1
+    
+    print(f"Completed analysis of {analyzed} files")
+    prune_reports(abs_directory_path, "suggestions")
+
+def prune_reports(directory, report_type):
+    """Delete the audits or suggestions under a directory whose Swift source no longer exists or is excluded."""
+    project_root = find_project_root(directory)
+    if not project_root:
+        return 0
+    
+    reports_root = os.path.join(REPORTS_DIR, report_type)
+    report_dir = os.path.normpath(os.path.join(reports_root, os.path.relpath(directory, project_root)))
+    suffix = REPORT_SUFFIXES[report_type]
+    
+    # Reuse this run's listing so reports of excluded and ignored files go too
+    swift_files = set(find_swift_files(directory))
+    
+    pruned = 0
+    for root, _, files in os.walk(report_dir, topdown=False):
+        source_dir = os.path.normpath(os.path.join(project_root, os.path.relpath(root, reports_root)))
+        for file in files:
+            name, extension = os.path.splitext(file)
+            if not name.endswith(suffix) or extension not in (".md", ".json"):
+                continue
+            name = name[:-len(suffix)]
+            
+            if os.path.join(source_dir, f"{name}.swift") in swift_files:
+                continue
+            # Directory summaries are named after the directory they cover
+            if name == os.path.basename(source_dir) and os.path.isdir(source_dir):
+                continue
+            
+            os.remove(os.path.join(root, file))
+            pruned += 1
+        
+        # Remove folders left empty by pruning, but never the reports folder itself
+        if root != report_dir and not os.listdir(root):
+            os.rmdir(root)
+    
+    if pruned:
+        print(f"Pruned {pruned} reports from reports/{report_type} whose Swift files no longer exist or are excluded")
+    return pruned
+
+def index_directory(directory, db_path=None):
+    """Build or incrementally update the symbol index for a directory."""
+    print_header(f"Indexing {directory}")
+    
+    abs_directory_path = os.path.abspath(directory)
+    project_root = find_project_root(abs_directory_path)
+    if not project_root:
+        print(f"Error: Could not determine project root for {abs_directory_path}")
+        return None
+    
+    swift_files = find_swift_files(abs_directory_path)
+    scope = os.path.relpath(abs_directory_path, project_root)
+    
+    index = SymbolIndex(db_path)
+    try:
+        with get_profiler().phase('index update'):
+            updated, removed = index.update(DocumentationGenerator(), swift_files, project_root, scope)
+    finally:
+        index.close()
+    
+    print(f"Indexed {len(swift_files)} Swift files ({updated} updated, {removed} removed)")
+    print(f"Symbol index saved to {os.path.abspath(index.db_path)}")
+    return index.db_path
+
+def query_index(query, kind=None, path=None, depth=1, db_path=None):
+    """Answer a question about the codebase from the symbol index."""
+    if not os.path.exists(db_path or DEFAULT_INDEX_PATH):
+        print("Error: No symbol index found. Run the index command first.")
+        return
+    
+    index = SymbolIndex(db_path)
+    try:
+        if query == "undocumented":
+            symbols = index.undocumented(kind, path)
+            for file_path, line, symbol_kind, name in symbols:
+                print(f"{file_path}:{line}: {symbol_kind} {name}")
+            print(f"\n{len(symbols)} undocumented symbols")
+        elif query == "coverage":
+            for folder, documented, total in index.coverage_by_folder(path, depth):
+                coverage = (documented / total * 100) if total > 0 else 0
+                print(f"{coverage:6.2f}%  {documented:5}/{total:<5}  {folder}")
+    finally:
+        index.close()
+
+def prioritize_files(results_file, top=PRIORITY_TOP, low_coverage=LOW_COVERAGE_THRESHOLD):
+    """List the files most in need of documentation, using the per-file results saved by an audit."""
+    print_header("Prioritizing Files for Documentation")
+    
+    results = load_audit_results(results_file) if results_file else None
+    if not results:
+        print("No audit results found to prioritize. Run an audit on a directory first.")
+        return
+    
+    # Files without any declarations have nothing to document
+    files = [(file_path, stats) for file_path, stats in results.get('files', {}).items() if stats.get('total_items', 0) > 0]
+    
+    zero_coverage_files = [(file_path, stats) for file_path, stats in files if stats.get('documented_items', 0) == 0]
+    print_priority_list(
+        "Files with 0% documentation coverage:",
+        "No files with 0% documentation coverage found.",
+        zero_coverage_files,
+        top
+    )
+    
+    low_coverage_files = [
+        (file_path, stats) for file_path, stats in files
+        if stats.get('documented_items', 0) > 0 and stats.get('coverage_percentage', 0) < low_coverage
+    ]
+    print()
+    print_priority_list(
+        f"Files with low documentation coverage (below {low_coverage:g}%):",
+        f"No files with low documentation coverage (below {low_coverage:g}%) found.",
+        low_coverage_files,
+        top
+    )
+
+def print_priority_list(title, empty_message, files, top):
+    """Print the files with the lowest coverage and the most undocumented items first, up to top of them."""
+    if not files:
+        print(empty_message)
+        return
+    
+    def undocumented(stats):
+        return stats['total_items'] - stats.get('documented_items', 0)
+    
+    def priority(entry):
+        stats = entry[1]
+        return stats.get('coverage_percentage', 0), -undocumented(stats)
+    
+    print(title)
+    for file_path, stats in heapq.nsmallest(top, files, key=priority):
+        print(f"- {file_path} ({stats.get('coverage_percentage', 0):.2f}%, {undocumented(stats)} undocumented)")
+    
+    if len(files) > top:
+        print(f"... and {len(files) - top} more")
+
+def main(argv=None, prog=None):
+    parser = argparse.ArgumentParser(prog=prog, description="Documentation workflow tool")
+    subparsers = parser.add_subparsers(dest="command", help="Command to run")
+    
+    # Analyze command
+    analyze_parser = subparsers.add_parser("analyze", help="Analyze a file and generate documentation suggestions")
+    analyze_parser.add_argument("file", help="Path to the file to analyze")
+    
+    # Audit command
+    audit_parser = subparsers.add_parser("audit", help="Run a documentation audit on a directory or file")
+    audit_parser.add_argument("path", help="Directory or file to audit")
+    audit_parser.add_argument("--since", metavar="GIT_REF", help="Only re-analyze files changed since this git ref, reusing the previous results for the rest")
+    audit_parser.add_argument("--shard", type=parse_shard, metavar="K/N", help="Only audit shard K of N and save partial results for the merge command")
+    
+    # Audit-file command
+    audit_file_parser = subparsers.add_parser("audit-file", help="Run a documentation audit on a single file")
+    audit_file_parser.add_argument("file", help="File to audit")
+    
+    # Analyze-all command
+    analyze_all_parser = subparsers.add_parser("analyze-all", help="Analyze all files in a directory recursively")
+    analyze_all_parser.add_argument("directory", help="Directory to analyze")
+    
+    # Workflow command
+    workflow_parser = subparsers.add_parser("workflow", help="Run a complete documentation workflow")
+    workflow_parser.add_argument("directory", help="Directory to audit")
+    workflow_parser.add_argument("--file", help="Optional specific file to analyze after the audit")
+    workflow_parser.add_argument("--analyze-all", action="store_true", help="Analyze all files in the directory after the audit")
+    workflow_parser.add_argument("--since", metavar="GIT_REF", help="Only re-audit files changed since this git ref, reusing the previous results for the rest")
+    
+    # Watch command
+    watch_parser = subparsers.add_parser("watch", help="Re-audit files in a directory as they change")
+    watch_parser.add_argument("directory", help="Directory to watch")
+    watch_parser.add_argument("--interval", type=float, default=0.1, help="Seconds between checks for changed files (default: 0.1)")
+    
+    # Index command
+    index_parser = subparsers.add_parser("index", help="Build or update the SQLite symbol index for a directory")
+    index_parser.add_argument("directory", help="Directory to index")
+    index_parser.add_argument("--db", help="Path to the index database (default: reports/.cache/symbols.db)")
+    
+    # Query command
+    query_parser = subparsers.add_parser("query", help="Query the symbol index without rescanning files")
+    query_parser.add_argument("query", choices=["undocumented", "coverage"], help="List undocumented symbols or coverage by folder")
+    query_parser.add_argument("--kind", choices=sorted(set(SYMBOL_KINDS.values())), help="Only list symbols of this kind")
+    query_parser.add_argument("--path", help="Only include files under this path, relative to the project root")
+    query_parser.add_argument("--depth", type=int, default=1, help="Folder depth to group coverage by (default: 1)")
+    query_parser.add_argument("--db", help="Path to the index database (default: reports/.cache/symbols.db)")
+    
+    # Merge command
+    merge_parser = subparsers.add_parser("merge", help="Combine the partial results of a sharded audit into the full reports")
+    merge_parser.add_argument("directory", help="Directory that was audited in shards")
+    merge_parser.add_argument("partials", nargs="+", help="Partial result files written by audit --shard or documentation_audit.py --shard")
+    merge_parser.add_argument("--audit-report", metavar="FILE", help="Also write documentation_audit.py's report for the directory to this file")
+    
+    # Prioritize command
+    prioritize_parser = subparsers.add_parser("prioritize", help="List the files most in need of documentation from a directory's last audit")
+    prioritize_parser.add_argument("directory", help="Directory that was audited")
+    
+    # Parallel analysis options for the commands that scan a whole directory
+    for command_parser in (audit_parser, analyze_all_parser, workflow_parser, watch_parser):
+        command_parser.add_argument("--jobs", "-j", type=int, default=default_jobs(), help="Number of worker processes (default: CPU count)")
+    
+    # Cache options for the commands that audit files
+    for command_parser in (audit_parser, audit_file_parser, workflow_parser, watch_parser):
+        command_parser.add_argument("--no-cache", action="store_true", help="Re-analyze every file instead of reusing cached results")
+    
+    # Report format options for the commands that write audit summaries
+    for command_parser in (audit_parser, workflow_parser, merge_parser):
+        command_parser.add_argument("--format", choices=REPORT_FORMATS, default="markdown", help="Also save the audit as a JSON document, JSON Lines or SARIF next to the markdown summary (default: markdown only)")
+    
+    # Prioritization options for the commands that list files to document
+    for command_parser in (workflow_parser, prioritize_parser):
+        command_parser.add_argument("--top", type=int, default=PRIORITY_TOP, help=f"Number of files to list per group (default: {PRIORITY_TOP})")
+        command_parser.add_argument("--low-coverage", type=float, default=LOW_COVERAGE_THRESHOLD, metavar="PERCENT", help=f"Coverage below which a documented file is listed as low (default: {LOW_COVERAGE_THRESHOLD:g})")
+    
+    # Time budget options for the commands that analyze files
+    for command_parser in (analyze_parser, audit_parser, audit_file_parser, analyze_all_parser, workflow_parser, watch_parser):
+        add_time_budget_argument(command_parser)
+    
+    # Timing and project root options for every command
+    for command_parser in subparsers.choices.values():
+        add_profile_arguments(command_parser)
+        command_parser.add_argument("--project-root", help="Project root that reports mirror paths from (default: found from markers such as KoenjiApp or .git)")
+    
+    args = parser.parse_args(argv)
+    
+    profile = getattr(args, "profile", None)
+    if profile:
+        enable_profiling(args.profile_top)
+    
+    project_root = getattr(args, "project_root", None)
+    if project_root:
+        if not os.path.isdir(project_root):
+            print(f"Error: Project root {project_root} is not a directory")
+            sys.exit(1)
+        set_project_root(project_root)
+    
+    time_budget = getattr(args, "time_budget", None)
+    if time_budget is not None:
+        set_time_budget(time_budget)
+    
+    if getattr(args, "shard", None) and args.format != "markdown":
+        print("Error: --format applies to the merged report; pass it to the merge command")
+        sys.exit(1)
+    
+    if args.command == "analyze":
+        analyze_file(args.file)
+    elif args.command == "audit":
+        run_audit(args.path, jobs=args.jobs, use_cache=not args.no_cache, since=args.since, report_format=args.format, shard=args.shard)
+    elif args.command == "audit-file":
+        audit_single_file(args.file, use_cache=not args.no_cache)
+    elif args.command == "analyze-all":
+        analyze_directory(args.directory, jobs=args.jobs)
+    elif args.command == "watch":
+        watch_directory(args.directory, interval=args.interval, jobs=args.jobs, use_cache=not args.no_cache)
+    elif args.command == "index":
+        index_directory(args.directory, db_path=args.db)
+    elif args.command == "query":
+        query_index(args.query, kind=args.kind, path=args.path, depth=args.depth, db_path=args.db)
+    elif args.command == "merge":
+        merge_audits(args.directory, args.partials, report_format=args.format, audit_report=args.audit_report)
+    elif args.command == "prioritize":
+        _, results_file = audit_summary_paths(args.directory)
+        prioritize_files(results_file, top=args.top, low_coverage=args.low_coverage)
+    elif args.command == "workflow":
+        # --analyze-all saves suggestions from the audit's own analysis
+        audit_report = run_audit(args.directory, jobs=args.jobs, use_cache=not args.no_cache, since=args.since, suggestions=args.analyze_all, report_format=args.format)
+        
+        # Directory audits save their per-file results next to the summary
+        results_file = os.path.splitext(audit_report)[0] + ".json" if audit_report else None
+        prioritize_files(results_file, top=args.top, low_coverage=args.low_coverage)
+        
+        if args.file and not args.analyze_all:
+            analyze_file(args.file)
+        elif not args.analyze_all:
+            # Suggest the command the same way this one was run
+            command = f"python3 -m {prog}" if prog else f"python3 {sys.argv[0]}"
+            print("\nTo analyze a specific file, run:")
+            print(f"{command} analyze path/to/file.swift")
+            print("\nTo analyze all files in a directory, run:")
+            print(f"{command} analyze-all path/to/directory")
+            print("\nOr add --analyze-all to the workflow command:")
+            print(f"{command} workflow path/to/directory --analyze-all")
+    else:
+        parser.print_help()
+    
+    if profile:
+        get_profiler().write_summary(sys.stderr, profile)
+
+if __name__ == "__main__":
+    main() 
\ No newline at end of file
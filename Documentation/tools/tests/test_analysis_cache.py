@@ -0,0 +1,79 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+
+from koenji_doctools.analysis_cache import AnalysisCache, CACHE_FILE_NAME
+from koenji_doctools.scheduling import TimingHistory
+
+class AnalysisCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache_file = os.path.join(self.directory.name, CACHE_FILE_NAME)
+    
+    def tearDown(self):
+        self.directory.cleanup()
+    
+    def cache(self, max_entries=3):
+        return AnalysisCache("1", cache_dir=self.directory.name, max_entries=max_entries)
+    
+    def test_entries_survive_a_save(self):
+        cache = self.cache()
+        cache.put("a", {"total_items": 1})
+        cache.save()
+        self.assertEqual(self.cache().get("a"), {"total_items": 1})
+    
+    def test_hits_do_not_rewrite_the_file(self):
+        cache = self.cache()
+        cache.put("a", {})
+        cache.save()
+        os.utime(self.cache_file, (0, 0))
+        
+        cache = self.cache()
+        self.assertEqual(cache.get("a"), {})
+        cache.save()
+        self.assertEqual(os.path.getmtime(self.cache_file), 0)
+    
+    def test_hits_are_evicted_last(self):
+        cache = self.cache()
+        for key in "abc":
+            cache.put(key, {})
+        cache.get("a")
+        cache.put("d", {})
+        self.assertEqual(list(cache.entries), ["c", "a", "d"])
+    
+    def test_unexpected_files_are_discarded(self):
+        for content in ("[1, 2]", '"text"', '{"version": "1", "entries": []}', '{"version": "0", "entries": {"a": {}}}'):
+            with self.subTest(content=content):
+                with open(self.cache_file, "w") as f:
+                    f.write(content)
+                cache = self.cache()
+                self.assertEqual(cache.entries, {})
+                cache.save()
+                with open(self.cache_file) as f:
+                    self.assertEqual(json.load(f), {"version": "1", "entries": {}})
+    
+    def test_save_errors_go_to_stderr(self):
+        # The cache folder can't be created where a file is in the way
+        blocked = os.path.join(self.directory.name, "blocked")
+        open(blocked, "w").close()
+        cache = AnalysisCache("1", cache_dir=os.path.join(blocked, "cache"))
+        cache.put("a", {})
+        errors = io.StringIO()
+        with redirect_stderr(errors):
+            cache.save()
+        self.assertIn("Error saving analysis cache", errors.getvalue())
+        self.assertTrue(cache.dirty)
+
+class TimingHistoryTests(unittest.TestCase):
+    def test_times_survive_a_save(self):
+        with tempfile.TemporaryDirectory() as directory:
+            timings = TimingHistory(cache_dir=directory)
+            timings.record(__file__, 2.0)
+            timings.save()
+            self.assertEqual(TimingHistory(cache_dir=directory).estimate(__file__), 2.0)
+
+if __name__ == '__main__':
+    unittest.main()
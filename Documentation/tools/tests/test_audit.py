@@ -0,0 +1,41 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from koenji_doctools import audit as audit_module, generator
+from koenji_doctools.audit import DocumentationAudit
+from koenji_doctools.scheduling import TimingHistory
+
+class DocumentationAuditTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = self.directory.name
+        for name in ("A.swift", "B.swift"):
+            with open(os.path.join(self.root, name), "w") as f:
+                f.write("/// Documented\nclass Documented {}\nfunc undocumented() {}\n")
+        
+        # Keep the timings of these files out of the reports folder
+        timings = mock.patch.object(audit_module, "TimingHistory", lambda: TimingHistory(cache_dir=self.root))
+        timings.start()
+        self.addCleanup(timings.stop)
+    
+    def tearDown(self):
+        self.directory.cleanup()
+    
+    def test_single_file_is_analyzed_in_process(self):
+        audit = DocumentationAudit(self.root, jobs=4, use_cache=False)
+        with mock.patch.object(generator, "_profiled_pool_map", side_effect=AssertionError("started a pool")):
+            stats = audit.analyze_file(os.path.join(self.root, "A.swift"))
+        self.assertEqual((stats.total_items, stats.documented_items), (2, 1))
+    
+    def test_closing_deletes_the_detail_file(self):
+        with DocumentationAudit(self.root, jobs=1, use_cache=False) as audit:
+            audit.run_audit()
+            details = audit.details
+            self.assertEqual(audit.file_stats("A.swift").methods, ("undocumented",))
+        self.assertTrue(details.file.closed)
+        self.assertIsNone(audit.details)
+
+if __name__ == '__main__':
+    unittest.main()
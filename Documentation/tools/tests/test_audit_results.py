@@ -0,0 +1,32 @@
+import io
+import json
+import unittest
+
+from koenji_doctools.analysis_results import FileStats
+from koenji_doctools.workflow import analyzer_version, write_audit_results
+
+class AuditResultsTests(unittest.TestCase):
+    def write(self, files):
+        stream = io.StringIO()
+        write_audit_results(stream, files)
+        return stream.getvalue()
+    
+    def test_layout_matches_a_whole_document_dump(self):
+        files = [
+            ("Views/A.swift", FileStats(3, 1, ("A",), (), ("b", "c"), ((1,), (), (4, 9)))),
+            ('Quoted "B".swift', FileStats(0, 0, (), (), ()))
+        ]
+        expected = json.dumps({
+            'version': analyzer_version(),
+            'files': {path: stats.to_dict() for path, stats in files}
+        }, indent=2)
+        self.assertEqual(self.write(files), expected)
+        self.assertEqual(self.write([]), json.dumps({'version': analyzer_version(), 'files': {}}, indent=2))
+    
+    def test_undocumented_items_round_trip(self):
+        stats = FileStats(4, 1, ("A",), ("run",), ("value",), ((2,), (7,), (12,)))
+        results = json.loads(self.write([("A.swift", stats)]))
+        self.assertEqual(FileStats.from_dict(results['files']["A.swift"]), stats)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+
+from koenji_doctools.generator import DocumentationGenerator, LineIndex
+
+def documented_names(source, mapped=False):
+    """Return {name: documented} for the declarations of a source, analyzed as text or as mapped bytes."""
+    content = source.encode('utf-8') if mapped else source
+    generator = DocumentationGenerator()
+    return {declaration.name: declaration.documented for declaration in generator.scan_declarations(content)}
+
+class DocCommentAttachmentTests(unittest.TestCase):
+    def assertDocumented(self, source, expected):
+        # Text and memory-mapped analysis have to agree
+        for mapped in (False, True):
+            with self.subTest(mapped=mapped):
+                self.assertEqual(documented_names(source, mapped), expected)
+    
+    def test_line_doc_comment(self):
+        self.assertDocumented("/// Doc\nvar a\nvar b\n", {'a': True, 'b': False})
+    
+    def test_multi_line_doc_block_only_documents_the_next_declaration(self):
+        source = "/**\n * Doc\n */\nvar b\nvar c\nvar d\n"
+        self.assertDocumented(source, {'b': True, 'c': False, 'd': False})
+    
+    def test_single_line_doc_block(self):
+        self.assertDocumented("/** Doc */\nvar a\nvar b\n", {'a': True, 'b': False})
+    
+    def test_ordinary_block_comment_is_not_documentation(self):
+        self.assertDocumented("/*\n Note\n */\nvar a\n/**/\nvar b\n", {'a': False, 'b': False})
+    
+    def test_attributes_and_comments_keep_the_doc_comment_attached(self):
+        source = "/// Doc\n@MainActor\n// note\n@available(iOS 15, *)\nfunc a() {}\n"
+        self.assertDocumented(source, {'a': True})
+    
+    def test_blank_line_and_code_detach_the_doc_comment(self):
+        source = "/// Doc\n\nvar a\n/// Doc\nprint(a)\nvar b\n"
+        self.assertDocumented(source, {'a': False, 'b': False})
+    
+    def test_nested_block_comments(self):
+        source = "/* outer /* inner */ still comment\nvar hidden\n*/\n/// Doc\nvar a\n"
+        self.assertDocumented(source, {'a': True})
+    
+    def test_file_ending_inside_block_comment(self):
+        # No trailing newline, and the comment is never closed
+        self.assertDocumented("func a() {}\n/*\n old code\n*/", {'a': False})
+        self.assertDocumented("/// Doc\nfunc a() {}\n/*\n unterminated", {'a': True})
+    
+    def test_attached_doc_table_covers_every_line(self):
+        # Each line maps to the nearest doc line above it, up to one past the last line
+        source = "/**\n * Doc\n */\nvar b\n/*\n x\n*/"
+        index = LineIndex(source)
+        self.assertEqual([index.attached_doc(line) for line in range(len(index.lines) + 1)], [-1, 0, 1, 2, -1, -1, -1, -1])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import os
+import tempfile
+import unittest
+
+from koenji_doctools.file_discovery import translate_pattern, IgnoreRules, iter_swift_files
+
+def matches(pattern, path):
+    """Return whether a .gitignore pattern's regex matches a path relative to its folder."""
+    regex, _, _ = translate_pattern(pattern)
+    return bool(regex.match(path))
+
+class TranslatePatternTests(unittest.TestCase):
+    def test_blanks_and_comments(self):
+        for line in ("", "   \n", "# comment\n", "/"):
+            with self.subTest(line=line):
+                self.assertIsNone(translate_pattern(line))
+    
+    def test_flags(self):
+        _, negated, directory_only = translate_pattern("!build/\n")
+        self.assertTrue(negated)
+        self.assertTrue(directory_only)
+        _, negated, directory_only = translate_pattern("\\!important")
+        self.assertFalse(negated)
+        self.assertFalse(directory_only)
+        self.assertTrue(matches("\\!important", "!important"))
+        self.assertTrue(matches("\\#file", "#file"))
+    
+    def test_unanchored_names_match_at_any_depth(self):
+        self.assertTrue(matches("Generated.swift", "Generated.swift"))
+        self.assertTrue(matches("Generated.swift", "a/b/Generated.swift"))
+        self.assertFalse(matches("Generated.swift", "NotGenerated.swift"))
+    
+    def test_slashes_anchor_to_the_folder(self):
+        self.assertTrue(matches("/Generated", "Generated"))
+        self.assertFalse(matches("/Generated", "a/Generated"))
+        self.assertTrue(matches("a/b", "a/b"))
+        self.assertFalse(matches("a/b", "x/a/b"))
+    
+    def test_wildcards(self):
+        self.assertTrue(matches("*.generated.swift", "View.generated.swift"))
+        self.assertFalse(matches("a/*.swift", "a/b/c.swift"))
+        self.assertTrue(matches("file?.swift", "file1.swift"))
+        self.assertFalse(matches("file?.swift", "file10.swift"))
+    
+    def test_double_star(self):
+        self.assertTrue(matches("**/Mocks", "Mocks"))
+        self.assertTrue(matches("**/Mocks", "a/b/Mocks"))
+        self.assertTrue(matches("a/**/b", "a/b"))
+        self.assertTrue(matches("a/**/b", "a/x/y/b"))
+        self.assertTrue(matches("a/**", "a/x/y"))
+    
+    def test_character_classes(self):
+        self.assertTrue(matches("file[0-9].swift", "file3.swift"))
+        self.assertFalse(matches("file[!0-9].swift", "file3.swift"))
+        self.assertTrue(matches("file[!0-9].swift", "fileA.swift"))
+    
+    def test_trailing_spaces_and_escapes(self):
+        self.assertTrue(matches("name   ", "name"))
+        self.assertTrue(matches("a\\*b", "a*b"))
+        self.assertFalse(matches("a\\*b", "axb"))
+
+class IgnoreRulesTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = self.directory.name
+        os.mkdir(os.path.join(self.root, ".git"))
+    
+    def tearDown(self):
+        self.directory.cleanup()
+    
+    def write(self, rel_path, text=""):
+        path = os.path.join(self.root, rel_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(text)
+        return path
+    
+    def listing(self, directory=""):
+        return sorted(os.path.relpath(path, self.root) for path in iter_swift_files(os.path.join(self.root, directory)))
+    
+    def test_last_matching_rule_wins(self):
+        self.write(".gitignore", "*.swift\n!Keep.swift\n")
+        rules = IgnoreRules.for_directory(self.root).child(self.root)
+        self.assertTrue(rules.ignored(os.path.join(self.root, "Drop.swift"), False))
+        self.assertFalse(rules.ignored(os.path.join(self.root, "Keep.swift"), False))
+    
+    def test_directory_only_rules(self):
+        self.write(".gitignore", "Generated/\n")
+        rules = IgnoreRules().child(self.root)
+        self.assertTrue(rules.ignored(os.path.join(self.root, "Generated"), True))
+        self.assertFalse(rules.ignored(os.path.join(self.root, "Generated"), False))
+    
+    def test_deeper_files_override_outer_ones(self):
+        self.write(".gitignore", "*.swift\n")
+        self.write("App/.gitignore", "!Kept.swift\n")
+        self.write("App/Kept.swift")
+        self.write("App/Dropped.swift")
+        self.assertEqual(self.listing(), [os.path.join("App", "Kept.swift")])
+    
+    def test_rules_above_the_listed_folder_apply(self):
+        self.write(".gitignore", "App/Generated\n")
+        self.write("App/Generated/A.swift")
+        self.write("App/B.swift")
+        self.assertEqual(self.listing("App"), [os.path.join("App", "B.swift")])
+    
+    def test_excluded_and_build_folders_are_pruned(self):
+        for rel_path in ("App/A.swift", "App/Tests/B.swift", "App/Previews/C.swift", ".build/D.swift", "Pods/E.swift"):
+            self.write(rel_path)
+        self.assertEqual(self.listing(), [os.path.join("App", "A.swift")])
+    
+    def test_folders_outside_a_repository_have_no_rules(self):
+        with tempfile.TemporaryDirectory() as directory:
+            self.assertEqual(IgnoreRules.for_directory(directory).groups, ())
+
+if __name__ == '__main__':
+    unittest.main()
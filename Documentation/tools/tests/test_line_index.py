@@ -0,0 +1,80 @@
+import os
+import unittest
+
+from koenji_doctools.generator import DocumentationGenerator, LineIndex, MappedLineIndex, SwiftScanner, ByteSwiftScanner
+
+# The Swift sources the tools are run on, at the top of the repository
+KOENJI_APP = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'KoenjiApp')
+
+def koenji_app_sources():
+    """Yield (path, bytes) for every Swift file of the app."""
+    for directory, _, names in sorted(os.walk(KOENJI_APP)):
+        for name in sorted(names):
+            if name.endswith('.swift'):
+                path = os.path.join(directory, name)
+                with open(path, 'rb') as f:
+                    yield path, f.read()
+
+@unittest.skipUnless(os.path.isdir(KOENJI_APP), "KoenjiApp sources are not checked out")
+class KoenjiAppParityTests(unittest.TestCase):
+    """Line lookups give what counting newlines in a slice of the file gave, for every declaration of the app."""
+    def test_text_line_numbers_and_context(self):
+        generator = DocumentationGenerator()
+        for path, data in koenji_app_sources():
+            content = data.decode('utf-8').replace('\r\n', '\n')
+            lines = content.split('\n')
+            index = LineIndex(content)
+            with self.subTest(path=os.path.relpath(path, KOENJI_APP)):
+                for _, _, offset in SwiftScanner().scan(content):
+                    line = content[:offset].count('\n')
+                    self.assertEqual(index.line_of(offset), line)
+                    context = '\n'.join(lines[max(0, line - 3):line + 4])
+                    self.assertEqual(generator.extract_context(content, offset, index=index), context)
+    
+    def test_mapped_line_numbers_and_context(self):
+        generator = DocumentationGenerator()
+        for path, data in koenji_app_sources():
+            lines = data.decode('utf-8').replace('\r\n', '\n').split('\n')
+            index = MappedLineIndex(data)
+            with self.subTest(path=os.path.relpath(path, KOENJI_APP)):
+                for _, _, offset in ByteSwiftScanner().scan(data):
+                    line = data[:offset].count(b'\n')
+                    self.assertEqual(index.line_of(offset), line)
+                    context = '\n'.join(lines[max(0, line - 3):line + 4])
+                    self.assertEqual(generator.extract_context(data, offset, index=index), context)
+    
+    def test_text_and_mapped_statistics_match(self):
+        generator = DocumentationGenerator()
+        for path, data in koenji_app_sources():
+            with self.subTest(path=os.path.relpath(path, KOENJI_APP)):
+                _, text_stats = generator.analyze_content(data.decode('utf-8').replace('\r\n', '\n'), analyze_only=True)
+                _, mapped_stats = generator.analyze_content(data, analyze_only=True)
+                self.assertEqual(text_stats, mapped_stats)
+
+class LineIndexTests(unittest.TestCase):
+    def test_line_of_every_offset(self):
+        content = "a\n\nbc\nd"
+        index = LineIndex(content)
+        mapped = MappedLineIndex(content.encode('utf-8'))
+        for offset in range(len(content) + 1):
+            self.assertEqual(index.line_of(offset), content[:offset].count('\n'))
+        # Mapped lookups walk from the last line looked up, so go backwards as well
+        for offset in reversed(range(len(content) + 1)):
+            self.assertEqual(mapped.line_of(offset), content[:offset].count('\n'))
+    
+    def test_line_range_past_the_end(self):
+        content = "a\nb\nc"
+        self.assertEqual(LineIndex(content).line_range(1, 10), ['b', 'c'])
+        self.assertEqual(MappedLineIndex(content.encode('utf-8')).line_range(1, 10), ['b', 'c'])
+    
+    def test_mapped_lines_drop_carriage_returns(self):
+        index = MappedLineIndex("é\r\nb\r\n".encode('utf-8'))
+        self.assertEqual(index.line_range(0, 3), ['é', 'b', ''])
+    
+    def test_check_is_called_while_indexing(self):
+        calls = []
+        LineIndex("x\n" * 1000, check=lambda: calls.append(1))
+        self.assertTrue(calls)
+
+if __name__ == '__main__':
+    unittest.main()
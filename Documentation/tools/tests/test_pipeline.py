@@ -0,0 +1,81 @@
+import unittest
+
+from koenji_doctools.pipeline import FLUSH, ordered_merge
+
+def buffering_process(misses, window=3):
+    """Process items a window at a time like the worker pool, handing back everything held at a FLUSH."""
+    buffered = []
+    for item in misses:
+        if item is FLUSH:
+            yield from ((miss, f"computed {miss}") for miss in buffered)
+            buffered = []
+            yield FLUSH, None
+            continue
+        
+        buffered.append(item)
+        if len(buffered) == window:
+            yield from ((miss, f"computed {miss}") for miss in buffered)
+            buffered = []
+    yield from ((miss, f"computed {miss}") for miss in buffered)
+
+class OrderedMergeTests(unittest.TestCase):
+    def merge(self, items, hits, depth=4, process=buffering_process):
+        """Run ordered_merge over items, returning its output, the most entries ever held and how often process started."""
+        looked_up = []
+        yielded = []
+        held = [0]
+        starts = [0]
+        
+        def lookup(item):
+            looked_up.append(item)
+            held[0] = max(held[0], len(looked_up) - len(yielded))
+            return f"hit {item}" if item in hits else None
+        
+        def counted_process(misses):
+            starts[0] += 1
+            return process(misses)
+        
+        for entry in ordered_merge(items, lookup, counted_process, depth=depth):
+            yielded.append(entry)
+        return yielded, held[0], starts[0]
+    
+    def test_results_are_yielded_in_input_order(self):
+        results, _, _ = self.merge(range(10), hits={1, 2, 5, 9})
+        self.assertEqual([item for item, _, _ in results], list(range(10)))
+        self.assertEqual(results[1], (1, "hit 1", True))
+        self.assertEqual(results[3], (3, "computed 3", False))
+    
+    def test_every_item_is_yielded_once(self):
+        results, _, _ = self.merge(range(20), hits=set(range(0, 20, 3)))
+        self.assertEqual([item for item, _, _ in results], list(range(20)))
+        self.assertEqual([looked_up for item, _, looked_up in results if item % 3 == 0], [True] * 7)
+    
+    def test_waiting_hits_are_bounded(self):
+        # Without a miss to hand back, process would otherwise hold every hit until the end
+        results, held, starts = self.merge(range(1000), hits=set(range(1000)))
+        self.assertEqual(len(results), 1000)
+        self.assertLessEqual(held, 4)
+        self.assertEqual(starts, 1)
+    
+    def test_waiting_hits_are_bounded_behind_misses(self):
+        results, held, starts = self.merge(range(1000), hits=set(range(1000)) - {0, 1, 500})
+        self.assertEqual([item for item, _, _ in results], list(range(1000)))
+        # Misses still being processed are held as well as the hits behind them
+        self.assertLessEqual(held, 4 + 2)
+        self.assertEqual(starts, 1)
+    
+    def test_flush_among_the_items_is_passed_on(self):
+        def inner(misses):
+            # An ordered_merge used as the process of another one
+            for item, result, _ in ordered_merge(misses, lambda item: None if item % 2 else f"hit {item}", buffering_process):
+                yield item, result
+        
+        results, held, _ = self.merge(range(200), hits=set(range(0, 200, 5)), process=inner)
+        self.assertEqual([item for item, _, _ in results], list(range(200)))
+        self.assertNotIn(FLUSH, [item for item, _, _ in results])
+    
+    def test_empty_input(self):
+        self.assertEqual(self.merge([], hits=set()), ([], 0, 1))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import os
+import tempfile
+import unittest
+
+from koenji_doctools.report_writer import ReportFile, ReportWriter, write_if_changed
+
+class ReportFileTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "report.md")
+    
+    def tearDown(self):
+        self.directory.cleanup()
+    
+    def write(self, *lines):
+        report_file = ReportFile(self.path)
+        with report_file as f:
+            ReportWriter(f).write_line("\n".join(lines))
+        return report_file.changed
+    
+    def read(self):
+        with open(self.path, encoding='utf-8') as f:
+            return f.read()
+    
+    def test_new_report_is_written(self):
+        self.assertTrue(self.write("# Report", "é"))
+        self.assertEqual(self.read(), "# Report\né")
+    
+    def test_unchanged_report_keeps_the_file(self):
+        self.write("# Report")
+        os.utime(self.path, (0, 0))
+        self.assertFalse(self.write("# Report"))
+        self.assertEqual(os.path.getmtime(self.path), 0)
+    
+    def test_same_size_different_content_is_written(self):
+        self.write("# Report A")
+        self.assertTrue(self.write("# Report B"))
+        self.assertEqual(self.read(), "# Report B")
+    
+    def test_failed_report_leaves_the_previous_one(self):
+        self.write("# Report")
+        with self.assertRaises(RuntimeError):
+            with ReportFile(self.path) as f:
+                f.write("# Half")
+                raise RuntimeError
+        self.assertEqual(self.read(), "# Report")
+        self.assertEqual(os.listdir(self.directory.name), ["report.md"])
+    
+    def test_no_temporary_files_are_left(self):
+        self.write("# Report")
+        self.write("# Report")
+        self.assertEqual(os.listdir(self.directory.name), ["report.md"])
+    
+    def test_write_if_changed(self):
+        self.assertTrue(write_if_changed(self.path, "text"))
+        self.assertFalse(write_if_changed(self.path, "text"))
+        self.assertTrue(write_if_changed(self.path, "other"))
+        self.assertEqual(self.read(), "other")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+
+from koenji_doctools.generator import SwiftScanner, ByteSwiftScanner, SCAN_WINDOW
+
+def declarations(source, mapped=False):
+    """Return (keyword, name) for the declarations the scanner finds, in text or in UTF-8 bytes."""
+    scanner = ByteSwiftScanner() if mapped else SwiftScanner()
+    content = source.encode('utf-8') if mapped else source
+    return [(keyword, name) for keyword, name, _ in scanner.scan(content)]
+
+class SwiftScannerTests(unittest.TestCase):
+    def assertDeclarations(self, source, expected):
+        # The text and byte scanners have to agree
+        for mapped in (False, True):
+            with self.subTest(mapped=mapped):
+                self.assertEqual(declarations(source, mapped), expected)
+    
+    def test_declaration_keywords(self):
+        source = "class A {}\nstruct B {}\nenum C {}\nprotocol D {}\nextension E {}\nfunc f() {}\nlet g = 1\nvar h = 2\n"
+        self.assertDeclarations(source, [
+            ('class', 'A'), ('struct', 'B'), ('enum', 'C'), ('protocol', 'D'),
+            ('extension', 'E'), ('func', 'f'), ('let', 'g'), ('var', 'h')
+        ])
+    
+    def test_offsets_point_at_the_keyword(self):
+        source = "  func é() {}\n"
+        self.assertEqual([offset for _, _, offset in SwiftScanner().scan(source)], [2])
+        self.assertEqual([offset for _, _, offset in ByteSwiftScanner().scan(source.encode('utf-8'))], [2])
+    
+    def test_comments_are_skipped(self):
+        source = "// func a()\n/* var b /* nested */ let c */\nfunc d() {}\n"
+        self.assertDeclarations(source, [('func', 'd')])
+    
+    def test_string_literals_are_skipped(self):
+        source = 'let a = "var b"\nlet c = """\nfunc d()\n"""\nlet e = #"func f "quoted" "#\n'
+        self.assertDeclarations(source, [('let', 'a'), ('let', 'c'), ('let', 'e')])
+    
+    def test_interpolations_are_skipped(self):
+        source = 'let a = "\\(value("func b")) var c"\nvar d = 1\n'
+        self.assertDeclarations(source, [('let', 'a'), ('var', 'd')])
+    
+    def test_unterminated_string_ends_at_the_line(self):
+        self.assertDeclarations('let a = "open\nvar b = 1\n', [('let', 'a'), ('var', 'b')])
+    
+    def test_class_modifiers_are_not_classes(self):
+        self.assertDeclarations("class func a() {}\nclass var b: Int { 1 }\n", [('func', 'a'), ('var', 'b')])
+    
+    def test_pattern_bindings_are_not_properties(self):
+        source = "if let a = x {}\nguard var b = y else {}\ncase let (c, d):\nfoo(e, let f)\nlet g = 1\n"
+        self.assertDeclarations(source, [('let', 'g')])
+    
+    def test_member_access_is_not_a_declaration(self):
+        self.assertDeclarations("let a = Foo.self.class\nx.func b\n", [('let', 'a')])
+    
+    def test_backticked_names(self):
+        self.assertDeclarations("var `default` = 1\nfunc `init`() {}\n", [('var', 'default'), ('func', 'init')])
+    
+    def test_keywords_inside_identifiers(self):
+        self.assertDeclarations("let classic = 1\nvar letter = 2\nfuncé()\n", [('let', 'classic'), ('var', 'letter')])
+    
+    def test_declarations_after_a_long_stretch_without_tokens(self):
+        filler = "1234567890\n" * (2 * SCAN_WINDOW // 11)
+        source = "let a = [\n" + filler + "]\nfunc b() {}\n"
+        self.assertDeclarations(source, [('let', 'a'), ('func', 'b')])
+    
+    def test_check_is_called_without_tokens(self):
+        source = "1234567890\n" * (3 * SCAN_WINDOW // 11)
+        for scanner, content in ((SwiftScanner(), source), (ByteSwiftScanner(), source.encode('utf-8'))):
+            calls = []
+            list(scanner.scan(content, check=lambda: calls.append(1)))
+            self.assertGreaterEqual(len(calls), 3)
+    
+    def test_check_can_stop_a_scan(self):
+        def check():
+            raise TimeoutError
+        
+        with self.assertRaises(TimeoutError):
+            list(SwiftScanner().scan("var a = 1\n" * 1000, check=check))
+
+if __name__ == '__main__':
+    unittest.main()
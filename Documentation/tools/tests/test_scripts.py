@@ -0,0 +1,27 @@
+import unittest
+
+import doc_workflow
+import documentation_audit
+import documentation_generator_v2
+from koenji_doctools import audit, generator, workflow
+
+class ScriptReExportTests(unittest.TestCase):
+    """The scripts in tools/ still provide the names code imported from them before the package existed."""
+    def test_generator_script(self):
+        self.assertIs(documentation_generator_v2.DocumentationGenerator, generator.DocumentationGenerator)
+        self.assertIs(documentation_generator_v2.main, generator.main)
+    
+    def test_audit_script(self):
+        self.assertIs(documentation_audit.DocumentationAudit, audit.DocumentationAudit)
+        self.assertEqual(documentation_audit.EXTENSIONS_TO_SCAN, [".swift"])
+        self.assertIn("Previews", documentation_audit.EXCLUDE_DIRS)
+        self.assertEqual(documentation_audit.PROJECT_ROOT, "KoenjiApp")
+    
+    def test_workflow_script(self):
+        for name in ("print_header", "run_command", "analyze_file", "audit_single_file", "run_audit",
+                     "find_project_root", "analyze_directory", "prioritize_files", "main"):
+            with self.subTest(name=name):
+                self.assertIs(getattr(doc_workflow, name), getattr(workflow, name))
+
+if __name__ == '__main__':
+    unittest.main()
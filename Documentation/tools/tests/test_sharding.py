@@ -0,0 +1,92 @@
+import io
+import os
+import tempfile
+import unittest
+
+from koenji_doctools.analysis_results import FileStats
+from koenji_doctools.sharding import (
+    home_shard, assign_shards, select_shard, write_partial_results, load_partial_results, merge_partial_results
+)
+
+def stats(total):
+    """Return statistics with one undocumented method, to tell files apart after a round trip."""
+    return FileStats(total, total - 1, (), (f"method{total}",), (), ((), (total,), ()))
+
+class ShardingTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = self.directory.name
+        self.files = []
+        for number, size in enumerate([9000, 50, 4000, 700, 700, 3000, 20, 1200, 0, 5000]):
+            path = os.path.join(self.root, f"Dir{number % 3}", f"File{number}.swift")
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as f:
+                f.write("x" * size)
+            self.files.append(path)
+    
+    def tearDown(self):
+        self.directory.cleanup()
+    
+    def write_shard(self, shard, version="3.3"):
+        """Write a shard's partial results, as a sharded audit would, and return the file."""
+        entries = [
+            (position, os.path.relpath(file_path, self.root), stats(position + 1))
+            for position, file_path in select_shard(self.files, self.root, shard)
+        ]
+        path = os.path.join(self.root, f"shard_{shard[0]}.jsonl")
+        with open(path, "w") as f:
+            write_partial_results(f, shard, version, len(self.files), entries)
+        return path
+    
+    def test_every_file_gets_exactly_one_shard(self):
+        for count in (1, 2, 3, 7):
+            with self.subTest(count=count):
+                shards = assign_shards(self.files, self.root, count)
+                self.assertEqual(len(shards), len(self.files))
+                self.assertTrue(all(0 <= shard < count for shard in shards))
+                
+                selected = [position for index in range(1, count + 1) for position, _ in select_shard(self.files, self.root, (index, count))]
+                self.assertEqual(sorted(selected), list(range(len(self.files))))
+    
+    def test_assignment_does_not_depend_on_listing_order(self):
+        shards = dict(zip(self.files, assign_shards(self.files, self.root, 3)))
+        reordered = list(reversed(self.files))
+        self.assertEqual(dict(zip(reordered, assign_shards(reordered, self.root, 3))), shards)
+    
+    def test_files_stay_on_their_home_shard_while_it_has_room(self):
+        # The largest file is placed first, into empty shards, and is under half of all bytes
+        shards = assign_shards(self.files, self.root, 2)
+        self.assertEqual(shards[0], home_shard(os.path.relpath(self.files[0], self.root), 2))
+        self.assertEqual(assign_shards(self.files, self.root, 1), [0] * len(self.files))
+    
+    def test_shards_are_balanced(self):
+        sizes = [os.path.getsize(file_path) for file_path in self.files]
+        shards = assign_shards(self.files, self.root, 3)
+        loads = [sum(size for size, shard in zip(sizes, shards) if shard == index) for index in range(3)]
+        # No shard goes past an even share by more than the largest file
+        self.assertLessEqual(max(loads), sum(sizes) / 3 + max(sizes))
+    
+    def test_merge_restores_listing_order(self):
+        paths = [self.write_shard((index, 3)) for index in (2, 3, 1)]
+        merged = list(merge_partial_results(load_partial_results(paths, "3.3")))
+        expected = [(os.path.relpath(file_path, self.root), stats(position + 1)) for position, file_path in enumerate(self.files)]
+        self.assertEqual(merged, expected)
+    
+    def test_merge_rejects_mismatched_shards(self):
+        with self.assertRaisesRegex(ValueError, "Missing the results of shard 2"):
+            load_partial_results([self.write_shard((1, 2))], "3.3")
+        with self.assertRaisesRegex(ValueError, "analyzer version"):
+            load_partial_results([self.write_shard((1, 1), version="3.2")], "3.3")
+        with self.assertRaisesRegex(ValueError, "one of 2"):
+            load_partial_results([self.write_shard((1, 2)), self.write_shard((2, 3))], "3.3")
+        with self.assertRaisesRegex(ValueError, "No partial results"):
+            load_partial_results([], "3.3")
+    
+    def test_partial_results_are_json_lines(self):
+        stream = io.StringIO()
+        written = write_partial_results(stream, (1, 1), "3.3", 1, [(0, "A.swift", stats(2))])
+        self.assertEqual(written, 1)
+        self.assertEqual(len(stream.getvalue().splitlines()), 2)
+
+if __name__ == '__main__':
+    unittest.main()
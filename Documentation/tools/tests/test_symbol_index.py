@@ -0,0 +1,49 @@
+import os
+import tempfile
+import unittest
+
+from koenji_doctools.generator import DocumentationGenerator
+from koenji_doctools.symbol_index import SymbolIndex
+
+SOURCE = """/// Documented
+class Model {}
+extension Model {
+    func load() {}
+}
+class Model {}
+/// Documented
+var count = 0
+"""
+
+class SymbolIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = self.directory.name
+        self.file_path = os.path.join(self.root, "Model.swift")
+        with open(self.file_path, "w") as f:
+            f.write(SOURCE)
+        
+        self.generator = DocumentationGenerator()
+        self.index = SymbolIndex(os.path.join(self.root, "symbols.db"))
+        self.index.update(self.generator, [self.file_path], self.root)
+    
+    def tearDown(self):
+        self.index.close()
+        self.directory.cleanup()
+    
+    def test_undocumented_lists_counted_symbols(self):
+        self.assertEqual(self.index.undocumented(), [("Model.swift", 4, "method", "load")])
+    
+    def test_undocumented_matches_the_analysis(self):
+        _, stats = self.generator.analyze_file(self.file_path, analyze_only=True)
+        self.assertEqual(len(self.index.undocumented()), stats.total_items - stats.documented_items)
+    
+    def test_extensions_are_listed_by_kind(self):
+        self.assertEqual(self.index.undocumented("extension"), [("Model.swift", 3, "extension", "Model")])
+        self.assertEqual(self.index.undocumented("class"), [])
+    
+    def test_coverage_by_folder(self):
+        self.assertEqual(self.index.coverage_by_folder(), [(".", 2, 3)])
+
+if __name__ == '__main__':
+    unittest.main()